@@ -0,0 +1,176 @@
+# ------------------- Python Micro-Benchmarking (Complete Notes) -------------------
+
+"""
+⏱ Timing code once with time.time() (list.py section 13, membership example in
+loops&conditional.py) is not reliable:
+- time.time() has a coarse resolution and can jump (clock adjustments)
+- the first run is slower (caches, memory allocation)
+- one run is noisy: other processes, garbage collection, CPU frequency changes
+
+A small benchmark harness fixes this:
+- time.perf_counter_ns() → high-resolution clock that never goes backwards
+- warmup runs that are thrown away
+- many repetitions → report median/min and spread, not one number
+- outliers (e.g. one run hit by a context switch) are detected and dropped
+- garbage collector switched off while timing
+- results saved as JSON so runs can be compared to spot regressions
+"""
+
+import os
+import sys
+
+# This folder also holds notes files named numbers.py and random.py. Python searches
+# the script's own folder first, so `import statistics` (which uses the real numbers
+# and random modules) would load those notes instead. Drop the folder from the import
+# path before anything else is imported.
+_notes_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _notes_dir]
+
+import gc
+import json
+import statistics
+import time
+
+# ------------------- 1. Timing One Function Reliably -------------------
+
+def _calibrate(func, min_time_ns=1_000_000):
+    """Find how many calls make one sample take at least min_time_ns (default 1 ms)."""
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        if time.perf_counter_ns() - start >= min_time_ns:
+            return number
+        number *= 2
+
+def _drop_outliers(samples):
+    """Tukey's rule: drop samples outside 1.5 × IQR of the middle 50%."""
+    if len(samples) < 4:
+        return samples, 0
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    kept = [s for s in samples if low <= s <= high]
+    return kept, len(samples) - len(kept)
+
+def measure(func, warmup=3, repeat=20, number=None, disable_gc=True):
+    """Time func() and return statistics in nanoseconds per call."""
+    number = number or _calibrate(func)
+    for _ in range(warmup):
+        func()
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    kept, outliers = _drop_outliers(samples)
+    return {
+        "median_ns": statistics.median(kept),
+        "mean_ns": statistics.fmean(kept),
+        "min_ns": min(kept),
+        "stdev_ns": statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+        "outliers": outliers,
+    }
+
+print(measure(lambda: sum(range(1000)), repeat=10))
+
+# ------------------- 2. A Suite of Named Benchmark Cases -------------------
+
+class BenchmarkSuite:
+    def __init__(self, name):
+        self.name = name
+        self.cases = {}
+        self.results = {}
+
+    def case(self, name):
+        """Decorator that registers a function as a benchmark case."""
+        def register(func):
+            self.cases[name] = func
+            return func
+        return register
+
+    def run(self, **options):
+        for name, func in self.cases.items():
+            self.results[name] = measure(func, **options)
+            r = self.results[name]
+            print(f"{name:35s} median {r['median_ns'] / 1000:10.2f} µs  "
+                  f"± {r['stdev_ns'] / 1000:.2f}  ({r['outliers']} outliers dropped)")
+        return self.results
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"suite": self.name, "created": time.time(), "results": self.results}, f, indent=2)
+
+    def compare(self, path, threshold=1.10):
+        """Compare with a previous JSON result file; report cases that got slower."""
+        with open(path) as f:
+            previous = json.load(f)["results"]
+        for name, result in self.results.items():
+            if name in previous:
+                ratio = result["median_ns"] / previous[name]["median_ns"]
+                flag = "REGRESSION" if ratio > threshold else "ok"
+                print(f"{name:35s} {ratio:5.2f}x previous  {flag}")
+
+# ------------------- 3. Ported Cases: list.py Section 13 -------------------
+
+suite = BenchmarkSuite("notes")
+
+@suite.case("list comprehension (10k squares)")
+def bench_list_comp():
+    squares = [x * x for x in range(10_000)]
+
+@suite.case("for loop + append (10k squares)")
+def bench_for_loop():
+    squares = []
+    for x in range(10_000):
+        squares.append(x * x)
+
+# ------------------- 4. Ported Cases: loops&conditional.py Membership -------------------
+
+large_list = list(range(1000000))
+large_set = set(large_list)
+
+@suite.case("999999 in list (1M items)")
+def bench_list_membership():
+    999999 in large_list
+
+@suite.case("999999 in set (1M items)")
+def bench_set_membership():
+    999999 in large_set
+
+# ------------------- 5. Running, Saving and Comparing -------------------
+
+suite.run(repeat=15)
+suite.save("bench_results.json")
+
+# Next time (e.g. after changing code or Python version), run again and compare:
+suite.run(repeat=15)
+suite.compare("bench_results.json")
+
+os.remove("bench_results.json")
+
+# ------------------- Summary -------------------
+
+"""
+✔ perf_counter_ns() → precise, monotonic timing
+✔ Warmup runs → skip cold caches and first-time allocations
+✔ Many repetitions → median, min, stdev instead of one noisy number
+✔ Drop outliers with the 1.5 × IQR rule
+✔ gc.disable() while timing → no random garbage collection pauses
+✔ Save results as JSON and compare runs to catch regressions
+"""
+
+# ------------------- End of Benchmarking Notes -------------------
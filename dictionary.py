@@ -2,6 +2,16 @@
 # It's unordered (in Python < 3.7), mutable, and indexed by keys (not positions).
 # Syntax: {key1: value1, key2: value2, ...}
 
+import os
+import sys
+
+# This folder also holds notes files named threading.py and random.py. Python searches
+# the script's own folder first, so `import threading` (used further down) would load
+# those notes instead of the real module. Drop the folder from the import path before
+# anything is imported.
+_notes_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _notes_dir]
+
 # ✅ Creating a dictionary
 my_dict = {
     "name": "Alice",
@@ -213,3 +223,799 @@ print(len(info))  # Output: 2
 # str(), type()
 print(str(info))  # Output: string representation
 print(type(info))  # Output: <class 'dict'>
+
+# ----------- Persistent (Immutable) Dictionary with Structural Sharing -----------
+
+"""
+copy.deepcopy(nested) copies EVERY key and value → O(size) for each snapshot.
+
+A persistent dictionary never changes in place. set()/delete() return a NEW
+dictionary that shares almost everything with the old one:
+- Keys live in a tree (a "hash array mapped trie", HAMT) chosen by their hash,
+  5 bits of the hash per level → 32 children per node, very shallow
+- Changing one key copies only the few nodes on the path to it: O(log n)
+- A snapshot is just keeping a reference to the current version: O(1)
+- evolver() gives a mutable helper for many updates in a row; nodes it created
+  itself are changed in place instead of copied again
+"""
+
+import time
+
+class _Leaf:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, h, key, value):
+        self.hash, self.key, self.value = h, key, value
+
+class _Collision:
+    # Several keys with exactly the same hash
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, h, pairs):
+        self.hash, self.pairs = h, pairs
+
+class _Node:
+    __slots__ = ("bitmap", "items", "owner")
+
+    def __init__(self, bitmap, items, owner=None):
+        self.bitmap, self.items, self.owner = bitmap, items, owner
+
+_EMPTY = _Node(0, [])
+_MASK64 = (1 << 64) - 1
+
+def _hash(key):
+    return hash(key) & _MASK64
+
+def _slot(node, h, shift):
+    bit = 1 << ((h >> shift) & 31)
+    return bit, bin(node.bitmap & (bit - 1)).count("1")
+
+def _editable(node, owner):
+    # Evolver-owned nodes are changed in place; everything else is copied first
+    if owner is not None and node.owner is owner:
+        return node
+    return _Node(node.bitmap, list(node.items), owner)
+
+def _branch(a, b, shift, owner):
+    """Build the smallest subtree holding two entries with different hashes."""
+    ia, ib = (a.hash >> shift) & 31, (b.hash >> shift) & 31
+    if ia == ib:
+        return _Node(1 << ia, [_branch(a, b, shift + 5, owner)], owner)
+    items = [a, b] if ia < ib else [b, a]
+    return _Node((1 << ia) | (1 << ib), items, owner)
+
+def _find(node, h, key):
+    shift = 0
+    while True:
+        bit, i = _slot(node, h, shift)
+        if not node.bitmap & bit:
+            return None
+        child = node.items[i]
+        if isinstance(child, _Node):
+            node, shift = child, shift + 5
+        elif isinstance(child, _Leaf):
+            return child if child.hash == h and child.key == key else None
+        else:
+            for pair in child.pairs:
+                if pair.key == key:
+                    return pair
+            return None
+
+def _assoc(node, shift, h, key, value, owner):
+    """Return (new_node, added) with key set to value."""
+    bit, i = _slot(node, h, shift)
+    leaf = _Leaf(h, key, value)
+    if not node.bitmap & bit:
+        new = _editable(node, owner)
+        new.bitmap |= bit
+        new.items.insert(i, leaf)
+        return new, True
+    child = node.items[i]
+    if isinstance(child, _Node):
+        new_child, added = _assoc(child, shift + 5, h, key, value, owner)
+    elif isinstance(child, _Leaf):
+        if child.hash == h and child.key == key:
+            if child.value is value:
+                return node, False
+            new_child, added = leaf, False
+        elif child.hash == h:
+            new_child, added = _Collision(h, (child, leaf)), True
+        else:
+            new_child, added = _branch(child, leaf, shift + 5, owner), True
+    elif child.hash == h:
+        others = tuple(p for p in child.pairs if p.key != key)
+        new_child, added = _Collision(h, others + (leaf,)), len(others) == len(child.pairs)
+    else:
+        new_child, added = _branch(child, leaf, shift + 5, owner), True
+    if new_child is child:
+        return node, added
+    new = _editable(node, owner)
+    new.items[i] = new_child
+    return new, added
+
+def _dissoc(node, shift, h, key, owner):
+    """Return (new_node, removed) without key."""
+    bit, i = _slot(node, h, shift)
+    if not node.bitmap & bit:
+        return node, False
+    child = node.items[i]
+    if isinstance(child, _Node):
+        new_child, removed = _dissoc(child, shift + 5, h, key, owner)
+        if not removed:
+            return node, False
+        if len(new_child.items) == 1 and not isinstance(new_child.items[0], _Node):
+            new_child = new_child.items[0]        # collapse a single entry back up
+        elif not new_child.items:
+            new_child = None
+    elif isinstance(child, _Leaf):
+        if not (child.hash == h and child.key == key):
+            return node, False
+        new_child = None
+    else:
+        others = tuple(p for p in child.pairs if p.key != key)
+        if len(others) == len(child.pairs):
+            return node, False
+        new_child = others[0] if len(others) == 1 else _Collision(h, others)
+    new = _editable(node, owner)
+    if new_child is None:
+        new.bitmap &= ~bit
+        del new.items[i]
+    else:
+        new.items[i] = new_child
+    return new, True
+
+def _walk(node):
+    for child in node.items:
+        if isinstance(child, _Node):
+            yield from _walk(child)
+        elif isinstance(child, _Leaf):
+            yield child
+        else:
+            yield from child.pairs
+
+class PersistentDict:
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, root=_EMPTY, length=0):
+        self._root, self._len = root, length
+
+    @classmethod
+    def from_dict(cls, d):
+        """Convert a (nested) dict; inner dicts become PersistentDicts too."""
+        e = cls().evolver()
+        for key, value in d.items():
+            e[key] = cls.from_dict(value) if isinstance(value, dict) else value
+        return e.persistent()
+
+    def to_dict(self):
+        return {k: v.to_dict() if isinstance(v, PersistentDict) else v for k, v in self.items()}
+
+    def get(self, key, default=None):
+        leaf = _find(self._root, _hash(key), key)
+        return default if leaf is None else leaf.value
+
+    def __getitem__(self, key):
+        leaf = _find(self._root, _hash(key), key)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf.value
+
+    def __contains__(self, key):
+        return _find(self._root, _hash(key), key) is not None
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return (leaf.key for leaf in _walk(self._root))
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [leaf.value for leaf in _walk(self._root)]
+
+    def items(self):
+        return [(leaf.key, leaf.value) for leaf in _walk(self._root)]
+
+    def __repr__(self):
+        return f"PersistentDict({dict(self.items())})"
+
+    def set(self, key, value):
+        root, added = _assoc(self._root, 0, _hash(key), key, value, None)
+        return self if root is self._root else PersistentDict(root, self._len + added)
+
+    def delete(self, key):
+        root, removed = _dissoc(self._root, 0, _hash(key), key, None)
+        if not removed:
+            raise KeyError(key)
+        return PersistentDict(root, self._len - 1)
+
+    def evolver(self):
+        return PersistentDict.Evolver(self)
+
+    class Evolver:
+        def __init__(self, original):
+            self._root, self._len = original._root, original._len
+            self._owner = object()               # marks nodes this evolver may edit
+
+        def __setitem__(self, key, value):
+            self._root, added = _assoc(self._root, 0, _hash(key), key, value, self._owner)
+            self._len += added
+
+        def __delitem__(self, key):
+            self._root, removed = _dissoc(self._root, 0, _hash(key), key, self._owner)
+            if not removed:
+                raise KeyError(key)
+            self._len -= 1
+
+        def persistent(self):
+            self._owner = object()               # later edits must copy again
+            return PersistentDict(self._root, self._len)
+
+config = PersistentDict.from_dict({"a": {"b": 1}, "debug": False})
+snapshot = config                          # O(1) snapshot: just keep the reference
+config = config.set("a", config["a"].set("b", 99))
+# (keys come back in hash order, not insertion order)
+print(snapshot.to_dict())                  # {'a': {'b': 1}, 'debug': False} → safe
+print(config.to_dict())                    # {'a': {'b': 99}, 'debug': False}
+print(config.delete("debug").to_dict())    # {'a': {'b': 99}}
+
+e = config.evolver()
+for i in range(3):
+    e[f"key{i}"] = i
+print(len(e.persistent()), len(config))    # 5 2
+
+# Benchmark: taking a snapshot of a nested 10k-key config, then changing one value
+nested_config = {f"service{i}": {"port": 8000 + i, "tags": f"t{i}"} for i in range(10_000)}
+persistent_config = PersistentDict.from_dict(nested_config)
+
+start = time.perf_counter()
+for _ in range(10):
+    snap = copy.deepcopy(nested_config)
+    nested_config["service0"]["port"] += 1
+print("deepcopy snapshot:", (time.perf_counter() - start) / 10)
+
+start = time.perf_counter()
+for _ in range(10):
+    snap = nested_config.copy()             # fast but shallow: inner dicts are shared!
+    nested_config["service0"] = dict(nested_config["service0"], port=1)
+print(".copy() snapshot:", (time.perf_counter() - start) / 10)
+
+start = time.perf_counter()
+for _ in range(10):
+    snap = persistent_config
+    persistent_config = persistent_config.set(
+        "service0", persistent_config["service0"].set("port", 1))
+print("PersistentDict snapshot + set:", (time.perf_counter() - start) / 10)
+
+# ----------- Concurrent Dictionary with Lock Striping -----------
+
+"""
+Sharing one dict between threads (threading.py) usually means one big lock around
+every access → threads wait for each other even when they touch different keys.
+
+Lock striping: split the map into N shards, each a small dict with its OWN lock.
+- A key always goes to shard hash(key) % N → threads using different shards don't block
+- Reads take no lock: a single dict lookup is atomic under the GIL
+- setdefault / pop / compute_if_absent run under the shard's lock → atomic
+- Iteration copies one shard at a time ("weakly consistent"): it never fails,
+  but changes made during iteration may or may not be seen
+"""
+
+import threading
+
+_MISSING = object()
+
+class ConcurrentMap:
+    def __init__(self, shards=16):
+        self._shards = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _index(self, key):
+        return hash(key) % len(self._shards)
+
+    def get(self, key, default=None):
+        return self._shards[self._index(key)].get(key, default)   # lock-free read
+
+    def __getitem__(self, key):
+        return self._shards[self._index(key)][key]
+
+    def __contains__(self, key):
+        return key in self._shards[self._index(key)]
+
+    def __setitem__(self, key, value):
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i][key] = value
+
+    def __delitem__(self, key):
+        i = self._index(key)
+        with self._locks[i]:
+            del self._shards[i][key]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def setdefault(self, key, default=None):
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].setdefault(key, default)
+
+    def pop(self, key, *default):
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i].pop(key, *default)
+
+    def compute_if_absent(self, key, factory):
+        """Return the value for key, calling factory(key) at most once if it is missing."""
+        i = self._index(key)
+        shard = self._shards[i]
+        value = shard.get(key, _MISSING)         # one lock-free lookup: no gap for a delete to slip into
+        if value is not _MISSING:
+            return value
+        with self._locks[i]:
+            value = shard.get(key, _MISSING)
+            if value is _MISSING:
+                value = shard[key] = factory(key)
+            return value
+
+    def update(self, other=(), **kwargs):
+        # Group keys by shard so each lock is taken once
+        groups = {}
+        for key, value in dict(other, **kwargs).items():
+            groups.setdefault(self._index(key), {})[key] = value
+        for i, group in groups.items():
+            with self._locks[i]:
+                self._shards[i].update(group)
+
+    def items(self):
+        for i, shard in enumerate(self._shards):
+            with self._locks[i]:
+                snapshot = list(shard.items())
+            yield from snapshot
+
+    def keys(self):
+        return (key for key, _ in self.items())
+
+    def values(self):
+        return (value for _, value in self.items())
+
+    def __iter__(self):
+        return self.keys()
+
+shared = ConcurrentMap()
+shared.update({"name": "Alice", "age": 25})
+print(shared.setdefault("city", "Mumbai"))               # Mumbai
+print(shared.compute_if_absent("101", lambda k: {"name": "Bob", "marks": 90}))
+print(shared.pop("age"), len(shared))                    # 25 3
+
+# Many threads counting words at the same time
+word_counts = ConcurrentMap()
+
+def count_words(words):
+    for word in words:
+        counter = word_counts.compute_if_absent(word, lambda k: [0, threading.Lock()])
+        with counter[1]:
+            counter[0] += 1
+
+threads = [threading.Thread(target=count_words, args=(["tea", "chai", "tea"] * 1000,)) for _ in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print({word: count for word, (count, _) in word_counts.items()})  # {'tea': 8000, 'chai': 4000} (order may vary)
+
+# Benchmark: one big lock vs lock striping, 90% reads / 10% writes
+class BigLockDict:
+    def __init__(self):
+        self._d = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._d.get(key, default)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._d[key] = value
+
+def mixed_load(m, n_ops=20_000):
+    for i in range(n_ops):
+        key = i % 1000
+        if i % 10 == 0:
+            m[key] = i
+        else:
+            m.get(key)
+
+for n_threads in (1, 4, 16, 32):
+    for label, m in (("big lock", BigLockDict()), ("striped", ConcurrentMap())):
+        threads = [threading.Thread(target=mixed_load, args=(m,)) for _ in range(n_threads)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        print(f"{n_threads:2d} threads, {label:8s}: {time.perf_counter() - start:.3f}s")
+
+# ----------- Compact Record Store for Many Same-Shaped Dicts -----------
+
+"""
+students = {"101": {"name": "Bob", "marks": 90}, ...}
+Every inner dict carries its own hash table and its own copy of the key slots.
+With millions of records that overhead is much bigger than the data itself.
+
+RecordStore keeps the data by COLUMN instead:
+- The schema (field names) is taken from the first record and stored once
+- int columns → array('q'), float columns → array('d'): raw 8-byte numbers
+- other columns (str, bool, ...) → a plain list; a column also becomes a list when a
+  value of another type arrives, so every value comes back exactly as it went in
+- store["101"] returns a tiny Row view (uses __slots__) pointing at a row number,
+  so store["101"]["marks"], "marks" in store["101"], .get() and list() still work
+  like the nested dict (Row is a Mapping)
+- Column scans (sum, filter) run over one compact array
+- del store[key] moves the LAST record into the freed row → O(1) per column
+  (a Row view of a deleted record must not be used afterwards)
+"""
+
+from array import array
+from collections.abc import Mapping
+import tracemalloc
+
+class Row(Mapping):
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store, self._index = store, index
+
+    def __getitem__(self, field):
+        return self._store._columns[field][self._index]
+
+    def __setitem__(self, field, value):
+        self._store._set(field, self._index, value)
+
+    def __iter__(self):
+        return iter(self._store._columns)
+
+    def __len__(self):
+        return len(self._store._columns)
+
+    def to_dict(self):
+        return {field: column[self._index] for field, column in self._store._columns.items()}
+
+    def __repr__(self):
+        return f"Row({self.to_dict()})"
+
+class RecordStore:
+    def __init__(self, records=None):
+        self._columns = {}        # field → array or list
+        self._rows = {}           # record key → row number
+        self._keys = []           # row number → record key
+        for key, record in (records or {}).items():
+            self[key] = record
+
+    _ARRAY_TYPES = {"q": int, "d": float}
+
+    @staticmethod
+    def _new_column(value):
+        # exact types: True must not turn into 1 (bool is a subclass of int)
+        if type(value) is int:
+            return array("q")
+        if type(value) is float:
+            return array("d")
+        return []
+
+    def _column_for(self, field, value):
+        """The column for field, turned into a plain list if value doesn't fit its array."""
+        column = self._columns[field]
+        if isinstance(column, array) and (
+                type(value) is not self._ARRAY_TYPES[column.typecode]
+                or (type(value) is int and not -2 ** 63 <= value < 2 ** 63)):
+            # e.g. 2 arriving in a float column would come back as 2.0 → use a general list
+            self._columns[field] = column = list(column)
+        return column
+
+    def _set(self, field, index, value):
+        self._column_for(field, value)[index] = value
+
+    def __setitem__(self, key, record):
+        if not self._columns:
+            self._columns = {field: self._new_column(value) for field, value in record.items()}
+        if record.keys() != self._columns.keys():
+            raise KeyError(f"record fields {list(record)} don't match schema {list(self._columns)}")
+        if key in self._rows:
+            for field, value in record.items():
+                self._set(field, self._rows[key], value)
+            return
+        for field, value in record.items():
+            self._column_for(field, value).append(value)
+        self._rows[key] = len(self._keys)
+        self._keys.append(key)
+
+    def __delitem__(self, key):
+        index = self._rows.pop(key)
+        last = len(self._keys) - 1
+        if index != last:                    # move the last record into the freed row
+            moved = self._keys[last]
+            self._keys[index] = moved
+            self._rows[moved] = index
+            for column in self._columns.values():
+                column[index] = column[last]
+        self._keys.pop()
+        for column in self._columns.values():
+            column.pop()
+
+    def __getitem__(self, key):
+        return Row(self, self._rows[key])
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def items(self):
+        return ((key, Row(self, index)) for key, index in self._rows.items())
+
+    def column(self, field):
+        return self._columns[field]
+
+    def where(self, field, predicate):
+        """Keys of records whose field matches predicate (one scan over one column)."""
+        column, keys = self._columns[field], self._keys
+        return [keys[i] for i, value in enumerate(column) if predicate(value)]
+
+store = RecordStore({
+    "101": {"name": "Bob", "marks": 90},
+    "102": {"name": "Tom", "marks": 85},
+})
+print(store["101"]["marks"])                 # 90
+store["103"] = {"name": "Sara", "marks": 95}
+store["102"]["marks"] = 88
+print(sum(store.column("marks")))            # 273
+print(store.where("marks", lambda m: m > 89))  # ['101', '103']
+del store["101"]
+print(len(store), store["103"]["name"])      # 2 Sara
+
+flags = RecordStore({"a": {"active": True, "score": 2.5}})
+flags["b"] = {"active": False, "score": 2}
+print(flags["a"]["active"], flags["b"]["score"])   # True 2 – not 1 and 2.0
+
+# The same works for lists of same-shaped dicts (like `items` in OOPs.py)
+items = RecordStore(dict(enumerate([
+    {"name": "Pen", "qty": 10, "price": 1.5},
+    {"name": "Notebook", "qty": 5, "price": 3.0},
+])))
+print(sum(q * p for q, p in zip(items.column("qty"), items.column("price"))))  # 30.0
+
+# Memory: 200,000 student records
+n = 200_000
+student_ids = [str(i) for i in range(n)]   # keys are created outside both measurements
+tracemalloc.start()
+as_dicts = {key: {"id": i, "marks": i % 100, "score": i * 0.5} for i, key in enumerate(student_ids)}
+dict_bytes = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+tracemalloc.start()
+as_store = RecordStore()
+for key, record in as_dicts.items():
+    as_store[key] = record
+store_bytes = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+# The key → row-number dict is now the biggest part; the columns themselves are ~8 bytes per value
+print(f"dict of dicts: {dict_bytes / 1024 / 1024:.1f} MB, RecordStore: {store_bytes / 1024 / 1024:.1f} MB")
+
+# ----------- Merging Many Dictionaries Efficiently -----------
+
+"""
+d1 | d2 | d3 builds a new dict at EVERY |: merging 100 big dicts this way copies the
+growing result 99 times. {**d1, **d2, ...} is a single pass but must list every dict.
+
+Three tools:
+- merge_all(*dicts)      → one result dict, each input copied into it exactly once
+                           (the first input is copied at its exact size with dict(), then
+                           update() adds the rest; Python has no API to presize a dict)
+- MergedView(*dicts)     → no copy at all: a read-only view that looks keys up in the
+                           inputs (last one wins, like |) and caches what it finds
+- deep_merge(*dicts, resolve=...) → merges nested dicts key by key; resolve(key, old, new)
+                           decides conflicts between non-dict values
+"""
+
+def merge_all(*dicts):
+    if not dicts:
+        return {}
+    result = dict(dicts[0])
+    for d in dicts[1:]:
+        result.update(d)
+    return result
+
+class MergedView(Mapping):
+    def __init__(self, *dicts):
+        self._dicts = dicts[::-1]   # search the last dict first (it has priority)
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        for d in self._dicts:
+            if key in d:
+                self._cache[key] = d[key]
+                return d[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        seen = set()
+        for d in reversed(self._dicts):
+            for key in d:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self._dicts))
+
+    def invalidate(self):
+        """Call after changing one of the underlying dicts."""
+        self._cache.clear()
+
+def deep_merge(*dicts, resolve=None):
+    """Recursively merge nested dicts; resolve(key, old, new) picks a value on conflicts."""
+    result = {}
+    for d in dicts:
+        for key, new in d.items():
+            if key not in result:
+                result[key] = deep_merge(new, resolve=resolve) if isinstance(new, dict) else new
+                continue
+            old = result[key]
+            if isinstance(old, dict) and isinstance(new, dict):
+                result[key] = deep_merge(old, new, resolve=resolve)
+            else:
+                result[key] = resolve(key, old, new) if resolve else new
+    return result
+
+defaults = {"db": {"host": "localhost", "port": 5432}, "debug": False, "tags": ["base"]}
+env = {"db": {"host": "prod-db"}, "tags": ["prod"]}
+local = {"debug": True}
+
+print(merge_all(defaults, env, local))          # same as defaults | env | local
+view = MergedView(defaults, env, local)
+print(view["debug"], view["db"])                # True {'host': 'prod-db'}
+print(deep_merge(defaults, env, local,
+                 resolve=lambda key, old, new: old + new if isinstance(old, list) else new))
+# {'db': {'host': 'prod-db', 'port': 5432}, 'debug': True, 'tags': ['base', 'prod']}
+
+# Benchmark: 100 layered dicts of 10,000 keys each (same code for 100k keys, just slower)
+layers = [{f"key{j}": i for j in range(i * 100, i * 100 + 10_000)} for i in range(100)]
+
+start = time.perf_counter()
+merged = {}
+for layer in layers:
+    merged = merged | layer                     # new dict at every step
+print("chained |:", time.perf_counter() - start)
+
+start = time.perf_counter()
+merged_once = merge_all(*layers)
+print("merge_all:", time.perf_counter() - start)
+
+start = time.perf_counter()
+lazy = MergedView(*layers)
+value = lazy["key5000"]
+print("MergedView (build + one lookup):", time.perf_counter() - start)
+print(merged == merged_once, value == merged["key5000"])  # True True
+
+# ----------- Disk-Backed Dictionary with an LRU Cache -----------
+
+"""
+A normal dict lives in RAM. For hundreds of millions of keys we keep the data in an
+on-disk hash file instead and only a small, hot part in memory:
+
+- dbm (standard library) stores bytes → bytes in a file. It uses gdbm/ndbm when
+  available: real on-disk hash tables, so opening a huge file is instant and nothing
+  is loaded up front. (The pure-Python fallback dbm.dumb reads its index on open.)
+- Keys and values are pickled (use simple keys like str, int or tuples: 1 and 1.0
+  are equal in a dict but pickle to different bytes)
+- An LRU cache (OrderedDict) keeps the most recently used values in memory
+- Writes and deletes are collected and written to disk in batches
+
+MutableMapping fills in get, setdefault, pop, items, keys, values, update, ...
+from the five basic methods below.
+"""
+
+import dbm
+import pickle
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+_DELETED = object()
+
+class DiskDict(MutableMapping):
+    def __init__(self, path, cache_size=10_000, batch_size=1_000):
+        self._db = dbm.open(path, "c")
+        self._cache = OrderedDict()     # key → value, most recently used last
+        self._cache_size = cache_size
+        self._pending = {}              # key → value or _DELETED, not yet on disk
+        self._batch_size = batch_size
+
+    def _remember(self, key, value):
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)   # drop the least recently used
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            value = self._pending[key]
+            if value is _DELETED:
+                raise KeyError(key)
+            return value
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        try:
+            value = pickle.loads(self._db[pickle.dumps(key)])
+        except KeyError:
+            raise KeyError(key) from None
+        self._remember(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._pending[key] = value
+        self._remember(key, value)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._pending[key] = _DELETED
+        self._cache.pop(key, None)
+
+    def __iter__(self):
+        self.flush()
+        for raw_key in self._db.keys():
+            yield pickle.loads(raw_key)
+
+    def __len__(self):
+        self.flush()
+        return len(self._db)
+
+    def flush(self):
+        for key, value in self._pending.items():
+            raw_key = pickle.dumps(key)
+            if value is _DELETED:
+                if raw_key in self._db:
+                    del self._db[raw_key]
+            else:
+                self._db[raw_key] = pickle.dumps(value)
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+with DiskDict("students_db") as db:
+    db["101"] = {"name": "Bob", "marks": 90}
+    db.update({"102": {"name": "Tom", "marks": 85}})
+    print(db.setdefault("103", {"name": "Sara", "marks": 95}))
+    print(db.pop("102")["name"])                # Tom
+
+# Reopening: nothing is loaded until a key is asked for
+start = time.perf_counter()
+with DiskDict("students_db") as db:
+    print("Reopened in", time.perf_counter() - start, "s")
+    print(db.get("101"), sorted(db.keys()))     # {'name': 'Bob', 'marks': 90} ['101', '103']
+
+import glob
+for name in glob.glob("students_db*"):
+    os.remove(name)
@@ -13,6 +13,16 @@ Files can be of two types:
 2. Binary files (.exe, .jpg, .mp4, etc.)
 """
 
+import os
+import sys
+
+# This folder also holds notes files named threading.py, numbers.py and random.py.
+# Python searches the script's own folder first, so asyncio and the thread pools used
+# below would load those notes instead of the real modules. Drop the folder from the
+# import path before anything is imported.
+_notes_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _notes_dir]
+
 # ------------------- 1. Opening a File -------------------
 
 """
@@ -147,6 +157,586 @@ if os.path.exists("delete_me.txt"):
     os.remove("delete_me.txt")
     print("File deleted")
 
+# ------------------- 16. Streaming Large Files in Chunks -------------------
+
+"""
+f.read() and f.readlines() load the WHOLE file into memory.
+For a multi-GB log that means multi-GB of RAM.
+
+Streaming keeps memory constant:
+- read_chunks() → yields fixed-size blocks (e.g. 1 MB) one at a time
+- read_lines()  → yields lines; a line cut in half at a chunk boundary is
+                  kept in a small "leftover" buffer and joined with the next chunk
+- BufferedWriter → collects many small write()/writelines() calls and sends
+                   them to the OS in one large write
+"""
+
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def read_lines(path, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    leftover = b""
+    for chunk in read_chunks(path, chunk_size):
+        lines = (leftover + chunk).split(b"\n")
+        leftover = lines.pop()            # last piece may be an incomplete line
+        for line in lines:
+            yield line.decode(encoding) + "\n"
+    if leftover:
+        yield leftover.decode(encoding)   # last line without a newline
+
+class BufferedWriter:
+    def __init__(self, path, buffer_size=CHUNK_SIZE, encoding="utf-8"):
+        self._f = open(path, "wb", buffering=0)  # raw file: we do the buffering
+        self._parts = []
+        self._size = 0
+        self._limit = buffer_size
+        self._encoding = encoding
+
+    def write(self, text):
+        data = text.encode(self._encoding)
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= self._limit:
+            self.flush()
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        if self._parts:
+            self._f.write(b"".join(self._parts))  # one big system call
+            self._parts.clear()
+            self._size = 0
+
+    def close(self):
+        self.flush()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+with BufferedWriter("stream.txt") as w:
+    w.writelines(["Line1\n", "Line2\n", "Line3"])
+
+for line in read_lines("stream.txt", chunk_size=4):  # tiny chunks split every line
+    print("Streamed:", line.strip())
+
+# Benchmark: whole-file reads vs streaming (peak memory and time)
+import time
+import tracemalloc
+
+def measure(label, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:12s} {elapsed:.3f}s, peak {peak / 1024 / 1024:.1f} MB")
+
+def count_read():
+    with open("big.log", "rb") as f:
+        return f.read().count(b"\n")
+
+def count_readlines():
+    with open("big.log", "r") as f:
+        return len(f.readlines())
+
+def count_streamed():
+    return sum(chunk.count(b"\n") for chunk in read_chunks("big.log"))
+
+# Small sizes keep these notes quick; the same code works unchanged on multi-GB files
+for size_mb in (1, 32):
+    with BufferedWriter("big.log") as w:
+        line = "2024-01-01 12:00:00 INFO request handled in 12ms\n"
+        w.writelines(line for _ in range(size_mb * 1024 * 1024 // len(line)))
+    print(f"{size_mb} MB file:")
+    measure("read()", count_read)
+    measure("readlines()", count_readlines)
+    measure("chunks", count_streamed)
+
+os.remove("big.log")
+os.remove("stream.txt")
+
+# ------------------- 17. Memory-Mapped Binary Files (Zero-Copy) -------------------
+
+"""
+f.read() on a binary file copies every byte into a new bytes object.
+
+mmap maps the file into memory instead: the OS loads pages only when they are touched.
+Slicing a memoryview of the map gives a window onto the file → nothing is copied.
+
+MappedFile supports:
+- read_at(offset, size) → random access by position
+- seek()/tell()/read(n) → same cursor style as section 7
+- records(size)         → iterate over fixed-width binary records
+"""
+
+import mmap
+import struct
+
+class MappedFile:
+    def __init__(self, path):
+        self._f = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)  # file must not be empty
+        except BaseException:
+            self._f.close()             # e.g. ValueError for an empty file: don't leak the handle
+            raise
+        self._view = memoryview(self._map)
+        self._pos = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def read_at(self, offset, size):
+        return self._view[offset:offset + size]
+
+    def seek(self, offset):
+        self._pos = offset
+
+    def tell(self):
+        return self._pos
+
+    def read(self, size=-1):
+        end = len(self._view) if size < 0 else self._pos + size
+        chunk = self._view[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+    def records(self, record_size):
+        for offset in range(0, len(self._view) - record_size + 1, record_size):
+            yield self._view[offset:offset + record_size]
+
+    def close(self):
+        # mmap.close() raises BufferError while any slice handed out is still alive
+        # (call .release() on slices, or copy them with bytes(), when done with them)
+        try:
+            self._view.release()
+            self._map.close()
+        finally:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except BufferError:
+            if exc_type is None:
+                raise
+            # An error is already on its way out of the with block: don't hide it
+
+with MappedFile("data.bin") as mf:
+    print("Current position:", mf.tell())        # 0
+    print("Reading:", bytes(mf.read(4)))         # b'This'
+    print("New position:", mf.tell())            # 4
+    mf.seek(8)
+    print("After seek:", bytes(mf.read(6)))      # b'binary'
+    print("Random access:", bytes(mf.read_at(15, 4)))  # b'data'
+
+# Fixed-width records: id (4-byte int) + price (8-byte float) = 12 bytes each
+record = struct.Struct("<id")
+with open("records.bin", "wb") as f:
+    for i in range(5):
+        f.write(record.pack(i, i * 1.5))
+
+with MappedFile("records.bin") as mf:
+    for raw in mf.records(record.size):
+        print("Record:", record.unpack(raw))  # unpack reads straight from the map
+        raw.release()
+
+os.remove("records.bin")
+
+# ------------------- 18. Async File I/O (with asyncio) -------------------
+
+"""
+functions.py (section 9) shows async functions running on an event loop.
+But open()/read()/write() are blocking: while one file is read, the whole loop stops.
+
+Fix: run the blocking calls on a dedicated thread pool and await the result.
+- aopen()        → async context manager around a normal file object
+- read_chunks()  → async generator of chunks
+- write_batched()→ joins many small pieces and writes them in one call
+- A Semaphore bounds how many files are open at once
+- Cancelling the awaiting task works as usual (the thread finishes its current call,
+  the result is thrown away; a file opened after the cancel is closed again)
+
+Python has no built-in io_uring support, so a thread pool is the portable option.
+"""
+
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+IO_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="file-io")
+IO_LIMIT = 64  # max files open at the same time
+
+class AsyncFile:
+    def __init__(self, f):
+        self._f = f
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(IO_POOL, func, *args)
+
+    async def read(self, size=-1):
+        return await self._run(self._f.read, size)
+
+    async def write(self, data):
+        return await self._run(self._f.write, data)
+
+    async def read_chunks(self, chunk_size=CHUNK_SIZE):
+        while True:
+            chunk = await self.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    async def write_batched(self, parts):
+        return await self.write(b"".join(parts) if "b" in self._f.mode else "".join(parts))
+
+    async def close(self):
+        await self._run(self._f.close)
+
+def _close_opened_file(opening):
+    if not opening.cancelled() and opening.exception() is None:
+        opening.result().close()
+
+class aopen:
+    _limits = weakref.WeakKeyDictionary()  # one Semaphore per event loop
+
+    def __init__(self, path, mode="r"):
+        self._path = path
+        self._mode = mode
+
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        self._limit = aopen._limits.setdefault(loop, asyncio.Semaphore(IO_LIMIT))
+        await self._limit.acquire()
+        opening = IO_POOL.submit(open, self._path, self._mode)
+        try:
+            f = await asyncio.wrap_future(opening)
+        except asyncio.CancelledError:
+            # open() may already be running in a worker thread and finish after the
+            # cancel: close the file as soon as it has been opened
+            opening.add_done_callback(_close_opened_file)
+            self._limit.release()
+            raise
+        except BaseException:
+            self._limit.release()
+            raise
+        self._file = AsyncFile(f)
+        return self._file
+
+    async def __aexit__(self, *exc):
+        try:
+            await self._file.close()
+        finally:
+            self._limit.release()
+
+os.makedirs("async_demo", exist_ok=True)
+paths = [os.path.join("async_demo", f"file_{i}.txt") for i in range(1000)]
+
+async def write_one(path, i):
+    async with aopen(path, "w") as f:
+        await f.write_batched([f"file {i}\n", "some content\n"])
+
+async def read_one(path):
+    async with aopen(path, "r") as f:
+        return "".join([chunk async for chunk in f.read_chunks()])
+
+async def async_main():
+    await asyncio.gather(*(write_one(p, i) for i, p in enumerate(paths)))
+    contents = await asyncio.gather(*(read_one(p) for p in paths))
+    return contents
+
+# Benchmark: sequential with open(...) loop vs concurrent async I/O
+start = time.perf_counter()
+for i, p in enumerate(paths):
+    with open(p, "w") as f:
+        f.write(f"file {i}\nsome content\n")
+for p in paths:
+    with open(p, "r") as f:
+        f.read()
+print("Sequential:", time.perf_counter() - start)
+
+start = time.perf_counter()
+contents = asyncio.run(async_main())
+print("Async:", time.perf_counter() - start)
+# On a fast local disk the thread hand-off can cost more than it saves;
+# the async version wins when each open/read waits on slow or network storage.
+print(contents[0].strip())  # file 0 ...
+
+for p in paths:
+    os.remove(p)
+os.rmdir("async_demo")
+
+# ------------------- 19. Bulk File Operations with os.scandir -------------------
+
+"""
+Section 15 does os.path.exists() and then os.remove(): two system calls per file,
+and another process can delete the file in between (a race).
+
+Better:
+- Just try the operation and catch FileNotFoundError ("easier to ask forgiveness")
+- os.scandir() lists a directory once and returns DirEntry objects that already
+  know the name, type and (on most systems) stat info → no extra call per file
+- Run the per-file calls on a thread pool (the OS releases the GIL during I/O)
+- Return a result per file instead of stopping at the first error
+"""
+
+import shutil
+
+def scan_files(root):
+    """Yield a DirEntry for every file under root (recursive)."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def bulk_exists(paths):
+    """One scandir per directory instead of one stat per path."""
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or ".", []).append(path)
+    result = {}
+    for directory, group in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            names = set()
+        for path in group:
+            result[path] = os.path.basename(path) in names
+    return result
+
+def _run_bulk(func, items, workers=16):
+    def safe(item):
+        try:
+            if isinstance(item, tuple):
+                func(*item)
+            else:
+                func(item)
+            return item, "ok"
+        except OSError as e:
+            return item, e
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(safe, items, chunksize=256))
+
+def bulk_delete(paths):
+    return _run_bulk(os.remove, paths)
+
+def bulk_copy(pairs):
+    return _run_bulk(shutil.copyfile, pairs)      # pairs of (src, dst)
+
+def bulk_truncate(paths, size=0):
+    return _run_bulk(lambda path: os.truncate(path, size), paths)
+
+os.makedirs("bulk_demo/sub", exist_ok=True)
+for i in range(3):
+    with open(f"bulk_demo/sub/f{i}.txt", "w") as f:
+        f.write("some text")
+
+files = [entry.path for entry in scan_files("bulk_demo")]
+print(bulk_exists(files + ["bulk_demo/missing.txt"]))
+print(bulk_copy([(p, p + ".bak") for p in files]))
+print(bulk_truncate(files, 4))
+print(bulk_delete(files + ["bulk_demo/missing.txt"]))   # missing file → FileNotFoundError, others → ok
+
+# Benchmark: exists()+remove() per file vs scandir + bulk delete
+def make_files(n):
+    for i in range(n):
+        with open(f"bulk_demo/sub/x{i}.tmp", "w"):
+            pass
+
+make_files(5000)
+start = time.perf_counter()
+for i in range(5000):
+    path = f"bulk_demo/sub/x{i}.tmp"
+    if os.path.exists(path):
+        os.remove(path)
+print("exists + remove:", time.perf_counter() - start)
+
+make_files(5000)
+start = time.perf_counter()
+bulk_delete([entry.path for entry in scan_files("bulk_demo") if entry.name.endswith(".tmp")])
+print("scandir + bulk_delete:", time.perf_counter() - start)
+# The thread pool pays off on real disks and network filesystems where each call waits;
+# on an in-memory filesystem with one CPU the plain loop can still be faster.
+
+shutil.rmtree("bulk_demo")
+
+# ------------------- 20. Append-Only Log with Group Commit -------------------
+
+"""
+Section 4 appends by open() → write() → close() for every record.
+Opening and closing a file per record is slow, and nothing forces the data to disk.
+
+AppendLog keeps the file open and uses "group commit":
+- Threads add records to a shared pending list
+- Whichever thread finds no write in progress becomes the "leader":
+  it takes ALL pending records and writes them in one call
+- Other threads just wait until their record has been written; if the write
+  fails, EVERY append() in that group raises, so no record is silently lost
+- os.fsync() (really on disk, survives a crash) is called every N records, and a
+  background thread makes sure it also happens at least every T milliseconds —
+  you choose the durability vs speed trade-off
+- rotate() renames the current file with os.replace (atomic) and starts a new one
+"""
+
+import threading
+
+class _Group:
+    # Records that are written together by one leader
+    __slots__ = ("records", "done", "error")
+
+    def __init__(self):
+        self.records, self.done, self.error = [], False, None
+
+class AppendLog:
+    def __init__(self, path, fsync_every=1000, fsync_interval_ms=100):
+        self._path = path
+        self._f = open(path, "ab")
+        self._fsync_every = fsync_every
+        self._cond = threading.Condition()
+        self._group = _Group()          # records waiting for the next write
+        self._writing = False           # True while a leader writes (without the lock)
+        self._unsynced = 0              # records written but not yet fsynced
+        self._sync_error = None
+        self._closed = threading.Event()
+        self._flusher = None
+        if fsync_interval_ms:
+            self._flusher = threading.Thread(
+                target=self._flush_every, args=(fsync_interval_ms / 1000,), daemon=True)
+            self._flusher.start()
+
+    def append(self, record):
+        with self._cond:
+            group = self._group
+            group.records.append(record.encode() + b"\n")
+            while not group.done:
+                if not self._writing:
+                    self._write_group()     # become the leader for the waiting group
+                else:
+                    self._cond.wait()
+        if group.error is not None:
+            raise OSError(f"record was not written to {self._path}") from group.error
+
+    def _write_group(self):
+        group, self._group = self._group, _Group()
+        self._writing = True
+        self._cond.release()             # let others keep queueing while we write
+        try:
+            self._f.write(b"".join(group.records))
+            self._f.flush()
+            self._unsynced += len(group.records)
+            if self._unsynced >= self._fsync_every:
+                os.fsync(self._f.fileno())
+                self._unsynced = 0
+        except Exception as e:
+            group.error = e              # reported to every append() in this group
+        finally:
+            self._cond.acquire()
+            self._writing = False
+            group.done = True
+            self._cond.notify_all()
+
+    def _flush_every(self, interval):
+        # Bounds how long a written record can stay un-fsynced, even if no more appends come
+        while not self._closed.wait(interval):
+            try:
+                self.sync(only_if_needed=True)
+            except OSError as e:
+                self._sync_error = e     # raised by the next sync() or close()
+
+    def sync(self, only_if_needed=False):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writing)
+            if self._sync_error is not None:
+                error, self._sync_error = self._sync_error, None
+                raise error
+            if self._unsynced or not only_if_needed:
+                self._f.flush()
+                os.fsync(self._f.fileno())
+                self._unsynced = 0
+
+    def rotate(self, archive_path):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writing and not self._group.records)
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._unsynced = 0
+            self._f.close()
+            os.replace(self._path, archive_path)   # atomic rename
+            self._f = open(self._path, "ab")
+
+    def close(self):
+        self._closed.set()
+        if self._flusher:
+            self._flusher.join()
+        try:
+            self.sync()
+        finally:
+            self._f.close()
+
+audit = AppendLog("audit.log")
+audit.append("user=alice action=login")
+audit.append("user=bob action=logout")
+audit.rotate("audit.log.1")
+audit.append("user=alice action=upload")
+audit.close()
+
+with open("audit.log.1") as f:
+    print("Archived:", f.read().splitlines())
+with open("audit.log") as f:
+    print("Current:", f.read().splitlines())
+
+# Benchmark: open/write/close per record vs group-committed log (4 threads)
+
+def per_record_append(n):
+    for i in range(n):
+        f = open("bench.log", "a")
+        f.write(f"record {i}\n")
+        f.close()
+
+def log_append(log, n):
+    for i in range(n):
+        log.append(f"record {i}")
+
+def run_threads(target, *args):
+    threads = [threading.Thread(target=target, args=args) for _ in range(4)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+print("open/write/close:", run_threads(per_record_append, 5000))
+os.remove("bench.log")
+
+bench_log = AppendLog("bench.log", fsync_every=10_000, fsync_interval_ms=50)
+print("AppendLog:", run_threads(log_append, bench_log, 5000))
+bench_log.close()
+
+for name in ("bench.log", "audit.log", "audit.log.1"):
+    os.remove(name)
+
 # ------------------- Summary -------------------
 
 """
@@ -158,6 +748,11 @@ if os.path.exists("delete_me.txt"):
 ✔ Handle exceptions for safety and debugging
 ✔ Use os module to work with file paths and existence
 ✔ Work with both text and binary data easily
+✔ Stream big files in chunks → memory stays constant
+✔ mmap + memoryview → zero-copy random access to binary files
+✔ aopen() + thread pool → file I/O that doesn't block the event loop
+✔ os.scandir + thread pool → bulk exists/delete/copy/truncate with per-file results
+✔ AppendLog → keep the file open, group commit, tunable fsync, atomic rotation
 """
 
 # ------------------- End of File Handling Notes -------------------
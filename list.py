@@ -1,5 +1,15 @@
 # 🎯 Topic: Lists in Python (a.k.a. Arrays in other languages)
 
+import os
+import sys
+
+# This folder also holds notes files called threading.py, numbers.py and random.py.
+# Python searches the script's own folder first, so the stdlib modules (and NumPy)
+# imported further down would load those notes instead of the real modules.
+# Drop the folder from the import path before anything else is imported.
+_notes_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _notes_dir]
+
 # ✅ In Python, a list is an ordered collection that allows storing multiple values in a single variable.
 
 # ▶️ To create a list, use square brackets []
@@ -316,6 +326,833 @@ for x in range(10_000):
     squares.append(x * x)
 print("For loop:", time.time() - start)
 
+# ⚠️ One time.time() run is noisy – see benchmarking.py for warmup, repetitions and statistics
+
+# ---------- 14. Typed Array-Backed List (for Big Numeric Data) ----------
+
+"""
+A Python list stores pointers; every number is a separate int/float object (~28-32 bytes)
+plus the 8-byte pointer in the list.
+
+The array module stores raw machine numbers side by side:
+- 'q' → int64, 'd' → float64 → 8 bytes per element, no per-element object
+- sum/max/min can run over one contiguous buffer
+
+TypedList wraps array.array with the same methods as list.
+If NumPy is installed, reductions view the same buffer as a NumPy array (no copy)
+and run in C; without NumPy they fall back to the built-in sum/max/min.
+NumPy adds int64 values in int64 and silently wraps around past 2**63, so sum()
+only uses it when no overflow is possible and otherwise adds exact Python ints.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except Exception:        # not installed (ImportError) or a broken install → pure Python
+    np = None
+
+class TypedList:
+    def __init__(self, typecode="q", values=()):
+        self._data = array(typecode, values)   # 'q' = int64, 'd' = float64
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return TypedList(self._data.typecode, self._data[i])
+        return self._data[i]
+
+    def __setitem__(self, i, value):
+        self._data[i] = value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self):
+        return f"TypedList({self._data.typecode!r}, {self._data.tolist()})"
+
+    def append(self, x):
+        self._data.append(x)
+
+    def extend(self, iterable):
+        self._data.extend(iterable)
+
+    def insert(self, i, x):
+        self._data.insert(i, x)
+
+    def pop(self, i=-1):
+        return self._data.pop(i)
+
+    def remove(self, x):
+        self._data.remove(x)
+
+    def index(self, x):
+        return self._data.index(x)
+
+    def count(self, x):
+        return self._data.count(x)
+
+    def sort(self, key=None, reverse=False):
+        self._data = array(self._data.typecode, sorted(self._data, key=key, reverse=reverse))
+
+    def _bulk(self):
+        # Zero-copy NumPy view of the array buffer (None when NumPy is missing)
+        if np is not None and len(self._data):
+            return np.frombuffer(self._data, dtype=self._data.typecode)
+        return None
+
+    def sum(self):
+        bulk = self._bulk()
+        if bulk is None:
+            return sum(self._data)
+        if bulk.dtype.kind in "iu":
+            largest = max(abs(int(bulk.min())), abs(int(bulk.max())))
+            if largest * len(bulk) >= 2 ** 63:      # the int64 total could wrap around
+                return sum(self._data)               # exact, like sum(list)
+        return bulk.sum().item()
+
+    def max(self):
+        bulk = self._bulk()
+        return bulk.max().item() if bulk is not None else max(self._data)
+
+    def min(self):
+        bulk = self._bulk()
+        return bulk.min().item() if bulk is not None else min(self._data)
+
+    def nbytes(self):
+        return sys.getsizeof(self._data)
+
+typed = TypedList("q", [1, 2, 3, 4, 2])
+typed.append(5)
+typed.extend([6, 7])
+typed.insert(2, 99)
+typed.remove(2)
+print(typed.pop(), typed.pop(1))           # 7 99
+print(typed)                               # TypedList('q', [1, 3, 4, 2, 5, 6])
+print(typed.index(4), typed.count(2))      # 2 1
+typed.sort(reverse=True)
+print(typed.sum(), typed.max(), typed.min())  # 21 6 1
+
+# The benchmarks in sections 14-18 only run when this file is run directly: the
+# process pool in section 19 starts workers that re-import it (Windows/macOS).
+if __name__ == "__main__":
+    # Memory and speed for one million numbers
+    n = 1_000_000
+    plain = list(range(n))
+    packed = TypedList("q", range(n))
+
+    plain_bytes = sys.getsizeof(plain) + sum(sys.getsizeof(x) for x in plain)
+    print(f"list:      {plain_bytes / 1024 / 1024:.1f} MB")
+    print(f"TypedList: {packed.nbytes() / 1024 / 1024:.1f} MB")
+
+    start = time.perf_counter()
+    sum(plain), max(plain), min(plain)
+    print("list reductions:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    packed.sum(), packed.max(), packed.min()
+    print("TypedList reductions:", time.perf_counter() - start)  # much faster with NumPy installed
+
+# ---------- 15. Vectorized, Lazy Expressions ----------
+
+"""
+A comprehension runs the interpreter once per element:
+    [i ** 2 for i in range(n)]
+
+Vectorized code describes the WHOLE operation once and runs the loop in C (NumPy).
+Lazy means nothing is computed until .collect():
+    v = vec(range(n))
+    squares = (v ** 2).collect()
+    evens   = v.filter(v % 2 == 0).collect()
+    labels  = where(v % 2 == 0, "Even", "Odd").collect()
+
+Chained operations build ONE expression, so:
+- without NumPy → one fused Python pass, no intermediate lists
+- with NumPy    → whole-array operations on a single array
+
+⚠ With NumPy, integers are 64-bit like in C, not unlimited like Python ints:
+  + and * can wrap around past ±2**63. ** checks for this and raises OverflowError.
+"""
+
+import operator
+
+def _checked_pow(base, exponent):
+    # NumPy integers are fixed-size (int64): a result past ±2**63 silently wraps around,
+    # while Python ints never overflow. Raise instead of returning a wrong number.
+    result = operator.pow(base, exponent)
+    if np is not None and isinstance(result, np.ndarray) and result.dtype.kind in "iu":
+        exact = np.power(np.asarray(base, dtype=float), np.asarray(exponent, dtype=float))
+        if np.any(np.abs(exact) >= 2.0 ** 63):
+            raise OverflowError("integer power too large for NumPy int64; use floats: (v * 1.0) ** n")
+    return result
+
+class Vec:
+    def __init__(self, source, py=None, np_fn=None, mask=None):
+        self.source = source
+        self._py = py or (lambda x: x)             # element → value
+        self._np = np_fn or (lambda a: a)          # array → array
+        self._mask = mask                          # Vec of booleans (filter), or None
+
+    # -- building expressions (nothing runs yet) --
+    def _lift(self, other):
+        if isinstance(other, Vec):
+            return other
+        return Vec(self.source, lambda x: other, lambda a: other)
+
+    def _binary(self, other, op, reverse=False):
+        other = self._lift(other)
+        left, right = (other, self) if reverse else (self, other)
+        lp, rp, ln, rn = left._py, right._py, left._np, right._np
+        return Vec(self.source, lambda x: op(lp(x), rp(x)),
+                   lambda a: op(ln(a), rn(a)), _joint_mask(self, other))
+
+    __add__ = lambda self, o: self._binary(o, operator.add)
+    __radd__ = lambda self, o: self._binary(o, operator.add, reverse=True)
+    __sub__ = lambda self, o: self._binary(o, operator.sub)
+    __rsub__ = lambda self, o: self._binary(o, operator.sub, reverse=True)
+    __mul__ = lambda self, o: self._binary(o, operator.mul)
+    __rmul__ = lambda self, o: self._binary(o, operator.mul, reverse=True)
+    __truediv__ = lambda self, o: self._binary(o, operator.truediv)
+    __rtruediv__ = lambda self, o: self._binary(o, operator.truediv, reverse=True)
+    __floordiv__ = lambda self, o: self._binary(o, operator.floordiv)
+    __rfloordiv__ = lambda self, o: self._binary(o, operator.floordiv, reverse=True)
+    __pow__ = lambda self, o: self._binary(o, _checked_pow)
+    __mod__ = lambda self, o: self._binary(o, operator.mod)
+    __neg__ = lambda self: self._binary(0, operator.sub, reverse=True)
+    __eq__ = lambda self, o: self._binary(o, operator.eq)
+    __ne__ = lambda self, o: self._binary(o, operator.ne)
+    __lt__ = lambda self, o: self._binary(o, operator.lt)
+    __le__ = lambda self, o: self._binary(o, operator.le)
+    __gt__ = lambda self, o: self._binary(o, operator.gt)
+    __ge__ = lambda self, o: self._binary(o, operator.ge)
+    # & and | combine masks: v.filter((v > 2) & (v < 5))  (don't use `and`/`or` here)
+    __and__ = lambda self, o: self._binary(o, operator.and_)
+    __or__ = lambda self, o: self._binary(o, operator.or_)
+    __hash__ = None
+
+    def map(self, func, np_func=None):
+        py = self._py
+        np_fn = self._np
+        # np_func: optional NumPy version of func; otherwise func is applied element-wise
+        return Vec(self.source, lambda x: func(py(x)),
+                   (lambda a: np_func(np_fn(a))) if np_func else (lambda a: np.vectorize(func)(np_fn(a))),
+                   self._mask)
+
+    def filter(self, condition):
+        # keep rows that pass this condition AND every filter applied before
+        mask = _joint_mask(self, condition)
+        mask = condition if mask is None else mask & condition
+        return Vec(self.source, self._py, self._np, mask)
+
+    # -- running the expression --
+    def collect(self):
+        if np is not None:
+            if isinstance(self.source, range):
+                data = np.arange(self.source.start, self.source.stop, self.source.step)
+            else:
+                data = np.asarray(self.source)
+            values = np.broadcast_to(self._np(data), data.shape)
+            if self._mask is not None:
+                values = values[self._mask._np(data)]
+            return values.tolist()
+        py = self._py
+        if self._mask is None:
+            return [py(x) for x in self.source]          # one fused pass
+        keep = self._mask._py
+        return [py(x) for x in self.source if keep(x)]
+
+def vec(source):
+    return Vec(source)
+
+def _joint_mask(*vecs):
+    """The filters of all operands combined: an element is kept only if every one keeps it."""
+    masks = [v._mask for v in vecs if v._mask is not None]
+    if not masks:
+        return None
+    mask = masks[0]
+    for other in masks[1:]:
+        if other is not mask:
+            mask = mask & other
+    return mask
+
+def where(condition, if_true, if_false):
+    cond, yes, no = condition, condition._lift(if_true), condition._lift(if_false)
+    return Vec(condition.source,
+               lambda x: yes._py(x) if cond._py(x) else no._py(x),
+               lambda a: np.where(cond._np(a), yes._np(a), no._np(a)),
+               _joint_mask(cond, yes, no))
+
+v = vec(range(5))
+print((v ** 2).collect())                            # [0, 1, 4, 9, 16]
+
+v = vec(range(11))
+print(v.filter(v % 2 == 0).collect())                # [0, 2, 4, 6, 8, 10]
+
+v = vec(range(6))
+print(where(v % 2 == 0, "Even", "Odd").collect())    # ['Even', 'Odd', 'Even', 'Odd', 'Even', 'Odd']
+
+print((v * 2 + 1).filter(v > 2).collect())           # [7, 9, 11] – one pass for both steps
+print(v.filter((v >= 2) & (v < 5)).collect())       # [2, 3, 4]
+print(where(v.filter(v > 2) % 2 == 0, "E", "O").collect())  # ['O', 'E', 'O'] – the filter carries over
+print((10 - v).collect(), (-v // 2).collect())       # [10, 9, 8, 7, 6, 5] [0, -1, -1, -2, -2, -3]
+
+if __name__ == "__main__":
+    # Section 13 comparison with a third column (vectorized)
+    # (100M elements would need several GB as a Python list, so the notes stop at 1M)
+    print(f"{'n':>10} {'list comp':>10} {'for loop':>10} {'vectorized':>11}")
+    for n in (10_000, 1_000_000):
+        start = time.perf_counter()
+        squares = [x * x for x in range(n)]
+        comp_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        squares = []
+        for x in range(n):
+            squares.append(x * x)
+        loop_time = time.perf_counter() - start
+
+        v = vec(range(n))
+        start = time.perf_counter()
+        squares = (v * v).collect()
+        vec_time = time.perf_counter() - start
+        print(f"{n:>10} {comp_time:>10.4f} {loop_time:>10.4f} {vec_time:>11.4f}")
+
+# ---------- 16. Compact 2-D Matrix (Strided Views, Tiled Transpose) ----------
+
+"""
+Section 5 transposes with a nested comprehension: a new list per row,
+and reading column-wise jumps all over memory.
+
+Matrix keeps ALL numbers in one flat array plus a little bookkeeping:
+- shape   → (rows, cols)
+- strides → how far to move in the flat array for +1 row / +1 column
+- offset  → where element [0, 0] starts
+
+Transpose = swap the shape and the strides → a VIEW, nothing is copied.
+Slicing rows/columns also just changes offset/shape → a view.
+copy() builds a new contiguous matrix; for a transposed view it copies in small
+square tiles so that reads and writes both stay inside a cache-sized block.
+"""
+
+class Matrix:
+    def __init__(self, rows, cols, data=None, strides=None, offset=0):
+        self.shape = (rows, cols)
+        self.data = data if data is not None else array("d", bytes(8 * rows * cols))
+        self.strides = strides or (cols, 1)
+        self.offset = offset
+
+    @classmethod
+    def from_rows(cls, rows):
+        m = cls(len(rows), len(rows[0]))
+        m.data = array("d", [x for row in rows for x in row])
+        return m
+
+    def _normalize(self, i, axis):
+        # range(n)[i] → negative indices count from the end, out of bounds → IndexError
+        return i if isinstance(i, slice) else range(self.shape[axis])[i]
+
+    def __getitem__(self, pos):
+        r, c = self._normalize(pos[0], 0), self._normalize(pos[1], 1)
+        if isinstance(r, slice) or isinstance(c, slice):
+            return self._view(r, c)
+        return self.data[self.offset + r * self.strides[0] + c * self.strides[1]]
+
+    def __setitem__(self, pos, value):
+        r, c = self._normalize(pos[0], 0), self._normalize(pos[1], 1)
+        self.data[self.offset + r * self.strides[0] + c * self.strides[1]] = value
+
+    def _view(self, r, c):
+        r = r if isinstance(r, slice) else slice(r, r + 1)    # r, c already normalized
+        c = c if isinstance(c, slice) else slice(c, c + 1)
+        r0, r1, rs = r.indices(self.shape[0])
+        c0, c1, cs = c.indices(self.shape[1])
+        return Matrix(len(range(r0, r1, rs)), len(range(c0, c1, cs)), self.data,
+                      (self.strides[0] * rs, self.strides[1] * cs),
+                      self.offset + r0 * self.strides[0] + c0 * self.strides[1])
+
+    @property
+    def T(self):
+        return Matrix(self.shape[1], self.shape[0], self.data,
+                      (self.strides[1], self.strides[0]), self.offset)
+
+    def _strided(self, start, count, step):
+        stop = start + count * step
+        return self.data[start:stop if stop >= 0 else None:step]  # C-level strided slice
+
+    def row(self, r):
+        r = self._normalize(r, 0)
+        return self._strided(self.offset + r * self.strides[0], self.shape[1], self.strides[1])
+
+    def copy(self, tile=64):
+        rows, cols = self.shape
+        out = Matrix(rows, cols)
+        if self.strides[1] == 1:                 # rows are contiguous → copy row slices
+            for r in range(rows):
+                out.data[r * cols:(r + 1) * cols] = self.row(r)
+            return out
+        (s0, s1), off = self.strides, self.offset
+        for r_tile in range(0, rows, tile):      # tiled copy for transposed views
+            for c_tile in range(0, cols, tile):
+                width = min(tile, cols - c_tile)
+                for r in range(r_tile, min(r_tile + tile, rows)):
+                    start = r * cols + c_tile
+                    out.data[start:start + width] = self._strided(off + r * s0 + c_tile * s1, width, s1)
+        return out
+
+    def row_sums(self):
+        return [sum(self.row(r)) for r in range(self.shape[0])]
+
+    def col_sums(self):
+        return self.T.row_sums()
+
+    def tolist(self):
+        return [list(self.row(r)) for r in range(self.shape[0])]
+
+m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+print(m.T.tolist())        # [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]] – no copy made
+print(m[:, 1:].tolist())   # [[2.0, 3.0], [5.0, 6.0]] – also a view
+print(m.row_sums(), m.col_sums())   # [6.0, 15.0] [5.0, 7.0, 9.0]
+
+m.T[0, 1] = 40             # views share the same buffer
+print(m[1, 0])             # 40.0
+print(m[-1, :].tolist())   # [[40.0, 5.0, 6.0]] – negative indices count from the end
+
+if __name__ == "__main__":
+    # Benchmark: nested comprehension transpose vs Matrix
+    # (4096x4096 works the same way but takes minutes in pure Python; 1024x1024 keeps these notes quick)
+    size = 1024
+    rows = [[float(r * size + c) for c in range(size)] for r in range(size)]
+    big = Matrix.from_rows(rows)
+
+    start = time.perf_counter()
+    transposed = [[row[i] for row in rows] for i in range(size)]
+    print("Comprehension transpose:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    view = big.T
+    print("Matrix.T (view):", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    materialized = view.copy()
+    print("Matrix.T.copy() (tiled):", time.perf_counter() - start)
+    print(materialized.row(3)[:3].tolist() == transposed[3][:3])  # True
+
+# ---------- 17. Lazy Pipelines (Flatten, Zip, Enumerate Without Big Lists) ----------
+
+"""
+Sections 7, 9 and 11 build a full list at every step:
+    flattened = [item for sublist in list_of_lists for item in sublist]
+    indexed   = [(i, val) for i, val in enumerate(data)]
+
+A lazy pipeline chains generators instead. Each step pulls ONE item at a time
+from the step before it, and nothing runs until a terminal "sink"
+(to_list, sum, count, first, take, for_each) asks for results.
+Memory stays constant, so the input can be bigger than RAM (e.g. lines of a huge file).
+"""
+
+import itertools
+from collections import deque
+
+class Pipeline:
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+
+    # -- lazy steps (return a new Pipeline) --
+    def map(self, func):
+        return Pipeline(map(func, self._it))
+
+    def filter(self, predicate):
+        return Pipeline(filter(predicate, self._it))
+
+    def flatten(self):
+        return Pipeline(itertools.chain.from_iterable(self._it))
+
+    def zip(self, *others):
+        return Pipeline(zip(self._it, *others))
+
+    def enumerate(self, start=0):
+        return Pipeline(enumerate(self._it, start))
+
+    def chunk(self, size):
+        def chunks(it):
+            while batch := list(itertools.islice(it, size)):
+                yield batch
+        return Pipeline(chunks(self._it))
+
+    def window(self, size):
+        def windows(it):
+            win = deque(itertools.islice(it, size - 1), maxlen=size)
+            for item in it:
+                win.append(item)
+                yield tuple(win)
+        return Pipeline(windows(self._it))
+
+    # -- terminal sinks (consume the pipeline) --
+    def __iter__(self):
+        return self._it
+
+    def to_list(self):
+        return list(self._it)
+
+    def take(self, n):
+        return list(itertools.islice(self._it, n))
+
+    def first(self, default=None):
+        return next(self._it, default)
+
+    def sum(self):
+        return sum(self._it)
+
+    def count(self):
+        return sum(1 for _ in self._it)
+
+    def for_each(self, func):
+        for item in self._it:
+            func(item)
+
+print(Pipeline([[1, 2], [3, 4], [5, 6]]).flatten().to_list())    # [1, 2, 3, 4, 5, 6]
+print(Pipeline([1, 2]).zip(["x", "y"]).to_list())               # [(1, 'x'), (2, 'y')]
+print(Pipeline(["a", "b", "c"]).enumerate().to_list())          # [(0, 'a'), (1, 'b'), (2, 'c')]
+print(Pipeline(range(10)).chunk(4).to_list())                   # [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+print(Pipeline(range(5)).window(3).to_list())                   # [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+
+# Works on an endless source – only what the sink asks for is ever computed
+evens_squared = (Pipeline(itertools.count())
+                 .filter(lambda x: x % 2 == 0)
+                 .map(lambda x: x * x)
+                 .take(5))
+print(evens_squared)                                            # [0, 4, 16, 36, 64]
+
+# Constant memory: 10 million items flow through, but only one chunk exists at a time
+total = (Pipeline(itertools.repeat([1, 2, 3], 10_000_000 // 3))
+         .flatten()
+         .chunk(1000)
+         .map(sum)
+         .sum())
+print(total)  # 19999998
+
+# ---------- 18. IndexedList (Fast index/count/in on Big Lists) ----------
+
+"""
+list.index(), list.count(), list.remove() and `x in list` scan the list from the
+start → O(n) each time. Called millions of times on a big list, that adds up.
+
+IndexedList is a normal list plus an index that stays correct on EVERY change:
+- each element gets a stable label (a number) when it is added; labels are kept in
+  the same order as the elements, in a parallel sorted list
+    position of an element = bisect(labels, its label) → O(log n)
+- a hash index maps value → sorted list of the labels holding that value
+- x in lst, lst.count(x)        → one dict lookup, O(1)
+- lst.index(x), lst.remove(x)   → dict lookup + binary search, O(log n)
+- insert/pop/del/lst[i] = x     → only the labels of the one element change
+  (the list itself still moves the elements after i, a fast C memmove)
+A new label goes halfway between its neighbours. Labels are spaced far apart, so
+only after ~32 inserts into the very same gap is everything renumbered (O(n)).
+Whole-list operations (sort, reverse, slice assignment, *=) rebuild the index once.
+Values must be hashable (like dict keys); the labels roughly double the memory.
+"""
+
+from bisect import bisect_left, insort
+
+_LABEL_GAP = 2 ** 32
+
+class IndexedList(list):
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._rebuild()
+
+    def _rebuild(self):
+        self._labels = list(range(0, _LABEL_GAP * len(self), _LABEL_GAP))
+        self._positions = {}                      # value → sorted labels
+        for label, value in zip(self._labels, self):
+            self._positions.setdefault(value, []).append(label)
+
+    def _new_label(self, i):
+        """Label for a new element at position i (between labels[i - 1] and labels[i])."""
+        labels = self._labels
+        if not labels:
+            return 0
+        if i == 0:
+            return labels[0] - _LABEL_GAP
+        if i == len(labels):
+            return labels[-1] + _LABEL_GAP
+        low, high = labels[i - 1], labels[i]
+        if high - low < 2:                        # no room left in this gap → renumber
+            self._rebuild()
+            low, high = self._labels[i - 1], self._labels[i]
+        return (low + high) // 2
+
+    def _forget(self, label, value):
+        labels = self._positions[value]
+        del labels[bisect_left(labels, label)]
+        if not labels:
+            del self._positions[value]
+
+    # -- fast lookups --
+    def __contains__(self, value):
+        return value in self._positions
+
+    def count(self, value):
+        return len(self._positions.get(value, ()))
+
+    def index(self, value, start=0, end=None):
+        labels = self._positions.get(value, ())
+        end = len(self) if end is None else end
+        start, end, _ = slice(start, end).indices(len(self))
+        if start < end:
+            k = bisect_left(labels, self._labels[start])    # first occurrence at or after start
+            if k < len(labels):
+                i = bisect_left(self._labels, labels[k])
+                if i < end:
+                    return i
+        raise ValueError(f"{value!r} is not in list")
+
+    def remove(self, value):
+        labels = self._positions.get(value)
+        if not labels:
+            raise ValueError(f"{value!r} is not in list")
+        del self[bisect_left(self._labels, labels[0])]
+
+    # -- single-element changes: update the index in O(log n) --
+    def append(self, value):
+        label = self._new_label(len(self))
+        self._labels.append(label)
+        self._positions.setdefault(value, []).append(label)   # largest label → stays sorted
+        super().append(value)
+
+    def extend(self, iterable):
+        for value in list(iterable):              # list() → lst.extend(lst) stops
+            self.append(value)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def insert(self, i, value):
+        i = slice(i, None).indices(len(self))[0]  # same clamping as list.insert
+        label = self._new_label(i)
+        self._labels.insert(i, label)
+        insort(self._positions.setdefault(value, []), label)
+        super().insert(i, value)
+
+    def pop(self, i=-1):
+        if not self:
+            raise IndexError("pop from empty list")
+        i = range(len(self))[i]                   # normalise negative index, IndexError if out of range
+        self._forget(self._labels.pop(i), self[i])
+        return super().pop(i)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._rebuild()
+        else:
+            self.pop(i)
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            super().__setitem__(i, value)
+            self._rebuild()
+            return
+        i = range(len(self))[i]
+        label = self._labels[i]                   # same slot → same label
+        self._forget(label, self[i])
+        insort(self._positions.setdefault(value, []), label)
+        super().__setitem__(i, value)
+
+    # -- whole-list changes: rebuild once --
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._rebuild()
+        return self
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._rebuild()
+
+    def clear(self):
+        super().clear()
+        self._rebuild()
+
+    def __reduce__(self):
+        # copy.copy, copy.deepcopy and pickle rebuild the object from its items, so the
+        # index is built fresh (the default would restore the old index, then append again)
+        return self.__class__, (list(self),)
+
+catalog = IndexedList(["Black Tea", "Green Tea", "Oolong Tea", "White Tea"])
+catalog[1] = "Masala Chai"
+print("Masala Chai" in catalog)    # True
+print(catalog.index("Oolong Tea")) # 2
+
+numbers = IndexedList([1, 2, 3, 4, 2])
+numbers.append(5)
+numbers.insert(2, 99)
+numbers.remove(2)
+print(numbers)                            # [1, 99, 3, 4, 2, 5]
+print(numbers.index(4), numbers.count(2)) # 3 1
+numbers.sort()
+print(numbers.index(99))                  # 5
+
+if __name__ == "__main__":
+    # Speed: repeated lookups on a large catalog
+    big_plain = [f"item-{i}" for i in range(200_000)]
+    big_indexed = IndexedList(big_plain)
+
+    start = time.perf_counter()
+    for _ in range(200):
+        big_plain.index("item-199999")
+    print("list.index:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(200):
+        big_indexed.index("item-199999")
+    print("IndexedList.index:", time.perf_counter() - start)
+
+    # Mixed workload: the index stays valid, so changes never force an O(n) rebuild
+    start = time.perf_counter()
+    for i in range(200):
+        big_plain.insert(0, f"new-{i}")
+        big_plain.index("item-199999")
+        big_plain.remove(f"item-{i}")
+    print("list insert/index/remove:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(200):
+        big_indexed.insert(0, f"new-{i}")
+        big_indexed.index("item-199999")
+        big_indexed.remove(f"item-{i}")
+    print("IndexedList insert/index/remove:", time.perf_counter() - start)
+
+# ---------- 19. External Merge Sort (Data Bigger Than RAM) ----------
+
+"""
+list.sort() and sorted() need every item in memory at once.
+External merge sort needs only one "run" in memory at a time:
+
+1. Read the input in runs of run_size items, sort each run, spill it to a temp file
+   (runs can be sorted in parallel on several processes)
+2. k-way merge: a heap holds the current smallest item of every run file
+   → heapq.merge() yields the next item of the overall order each time
+
+Same key= and reverse= arguments as sorted(); the result is a lazy iterator.
+"""
+
+import heapq
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+@contextmanager
+def _spawn_without_script_dir():
+    """Start worker processes with PYTHONSAFEPATH=1 (Python 3.11+), then restore it.
+
+    A "spawn" worker (Windows/macOS) puts the current folder on sys.path before it
+    runs any of this file, so started from the notes folder it would import the notes
+    threading.py. Only processes started inside the with block see the setting.
+    """
+    old = os.environ.get("PYTHONSAFEPATH")
+    os.environ["PYTHONSAFEPATH"] = "1"
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop("PYTHONSAFEPATH", None)
+        else:
+            os.environ["PYTHONSAFEPATH"] = old
+
+def _write_run(items, key, reverse, directory, batch=1000):
+    items.sort(key=key, reverse=reverse)
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for i in range(0, len(items), batch):
+                pickle.dump(items[i:i + batch], f)   # a few large pickles, not one per item
+    except BaseException:
+        os.remove(path)                              # e.g. an item that can't be pickled
+        raise
+    return path
+
+def _read_run(path):
+    try:
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    yield from pickle.load(f)
+                except EOFError:
+                    break
+    finally:
+        os.remove(path)
+
+def _runs(iterable, run_size):
+    it = iter(iterable)
+    while run := list(itertools.islice(it, run_size)):
+        yield run
+
+def external_sorted(iterable, key=None, reverse=False, run_size=100_000, workers=0, directory=None):
+    """Sort any number of items using about run_size items of memory per worker.
+
+    workers > 0 sorts runs in separate processes (key must then be picklable:
+    a named function such as abs or str.lower, not a lambda).
+    """
+    paths, pending = [], []
+    try:
+        if workers:
+            with _spawn_without_script_dir(), ProcessPoolExecutor(workers) as pool:
+                try:
+                    for run in _runs(iterable, run_size):
+                        pending.append(pool.submit(_write_run, run, key, reverse, directory))
+                        if len(pending) >= 2 * workers:      # bound how many runs are in memory
+                            paths.append(pending.pop(0).result())
+                    while pending:
+                        paths.append(pending.pop(0).result())
+                except BaseException:
+                    for future in pending:
+                        future.cancel()                      # don't start runs nobody needs
+                    raise
+        else:
+            for run in _runs(iterable, run_size):
+                paths.append(_write_run(run, key, reverse, directory))
+    except BaseException:
+        # The input, key or a worker failed: delete every run file already written
+        # (with 50 GB of input these can be gigabytes in the temp folder).
+        # The pool has shut down by now, so every future that wasn't cancelled is done.
+        for future in pending:
+            if not future.cancelled() and future.exception() is None:
+                paths.append(future.result())
+        for path in paths:
+            os.remove(path)
+        raise
+    return heapq.merge(*(_read_run(p) for p in paths), key=key, reverse=reverse)
+
+print(list(external_sorted([5, 2, 9, 1], run_size=2)))                 # [1, 2, 5, 9]
+print(list(external_sorted([5, 2, 9, 1], reverse=True, run_size=2)))   # [9, 5, 2, 1]
+print(list(external_sorted([-3, 1, -2, 4], key=abs, run_size=2)))      # [1, -2, -3, 4]
+
+# Sorting the lines of a file that we pretend is too big for memory:
+# only run_size lines plus one buffered batch per run are ever held at once.
+# Process pools re-import this file in every worker on Windows/macOS, so the whole
+# demo (creating, sorting and deleting the files) sits under the __main__ guard.
+if __name__ == "__main__":
+    with open("unsorted.txt", "w") as f:
+        f.writelines(f"{(i * 7919) % 100_000:06d}\n" for i in range(100_000))
+
+    start = time.perf_counter()
+    with open("unsorted.txt") as f, open("sorted.txt", "w") as out:
+        out.writelines(external_sorted(f, run_size=20_000, workers=2))
+    print("External sort (2 processes):", time.perf_counter() - start)
+
+    with open("sorted.txt") as f:
+        print(f.readline().strip(), f.readline().strip())  # 000000 000001
+    os.remove("sorted.txt")
+    os.remove("unsorted.txt")
+
 # ---------- Summary ----------
 
 """
@@ -326,6 +1163,12 @@ print("For loop:", time.time() - start)
 ✔ Can include functions
 ✔ Faster than traditional loops in most cases
 ✔ Not suitable for very complex logic → prefer loops in that case
+✔ Big numeric data → TypedList (array-backed, 8 bytes per number)
+✔ Whole-sequence math → lazy vec() expressions (NumPy when installed)
+✔ 2-D data → Matrix: one flat buffer, transpose/slices are views
+✔ Huge or endless inputs → lazy Pipeline, build a list only at the end
+✔ Many lookups on a big list → IndexedList (hash index of positions)
+✔ Data bigger than RAM → external_sorted(): sorted runs on disk + heap merge
 """
 
 # 🧠 Things to remember:
@@ -361,6 +361,7 @@ print("Time (list):", time.time() - start)
 start = time.time()
 print(999999 in large_set)    # Faster
 print("Time (set):", time.time() - start)
+# (For trustworthy numbers use the harness in benchmarking.py)
 
 # ---------- 5. Dictionaries ----------
 
@@ -1,3 +1,13 @@
+import os
+import sys
+
+# This folder also holds notes files named threading.py, numbers.py and random.py.
+# Python searches the script's own folder first, so concurrent.futures (used for the
+# process pool below) would load those notes instead of the real modules. Drop the
+# folder from the import path before anything is imported.
+_notes_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _notes_dir]
+
 # ---- Set Basics ----
 
 # 1. Creating a set
@@ -145,3 +155,626 @@ print(squares)  # Output: {0, 1, 4, 9, 16}
 
 print(set("banana"))  # Output: {'b', 'n', 'a'}
 print(set([1, 2, 2, 3]))  # Output: {1, 2, 3}
+
+# ---- Bitmap Set for Dense Integer IDs ----
+
+"""
+A Python set of ints stores a hash slot plus a separate int object per element
+(~60+ bytes each). For dense integer IDs a bitmap needs just 1 bit per possible ID.
+
+BitmapSet works like "roaring" bitmaps:
+- Split each ID into high 16 bits (which chunk) and low 16 bits (position in chunk)
+- Each chunk ("container") holds up to 65,536 positions and is stored as either
+  - a SORTED array of uint16 (2 bytes per element) when it has ≤ 4096 elements
+    (sparse) → membership is a binary search, or
+  - a 65,536-bit bitmap (8 KB bytearray) when it is denser → add/discard flip one bit
+- Set algebra works chunk by chunk and picks the cheapest route for each pair:
+  - bitmap with bitmap → turn both into one Python int and do a single int operation
+    (|, &, ^, & ~), which Python runs in C over whole machine words
+  - array with array → combine just the (at most 4096) stored positions, never
+    building an 8 KB bitmap for a sparse chunk
+  - array with bitmap → test or flip one bit per array element
+- Building from many IDs groups them by chunk first and fills each chunk in one go
+"""
+
+from array import array
+from bisect import bisect_left
+
+_ARRAY_MAX = 4096
+_CHUNK_BYTES = 65536 // 8
+_EMPTY_BITMAP = bytes(_CHUNK_BYTES)
+_BYTE_BITS = [[b for b in range(8) if byte >> b & 1] for byte in range(256)]
+
+def _bitmap(lows, buf=None):
+    """Set the bits for lows in a bytearray bitmap (a new one unless buf is given)."""
+    buf = bytearray(_CHUNK_BYTES) if buf is None else buf
+    for low in lows:
+        buf[low >> 3] |= 1 << (low & 7)
+    return buf
+
+def _to_bits(container):
+    if isinstance(container, bytearray):
+        return int.from_bytes(container, "little")
+    return int.from_bytes(_bitmap(container), "little")
+
+def _positions(data):
+    return [i * 8 + b for i, byte in enumerate(data) if byte for b in _BYTE_BITS[byte]]
+
+def _pack(bits):
+    """Choose the smaller form for a chunk given as an int; None if it is empty."""
+    if not bits:
+        return None
+    if bin(bits).count("1") > _ARRAY_MAX:
+        return bytearray(bits.to_bytes(_CHUNK_BYTES, "little"))
+    return array("H", _positions(bits.to_bytes(_CHUNK_BYTES, "little")))
+
+def _copy(container):
+    return bytearray(container) if isinstance(container, bytearray) else array("H", container)
+
+def _from_lows(lows):
+    """Chunk for sorted positions: an array when sparse, a bitmap when dense."""
+    if not lows:
+        return None
+    return array("H", lows) if len(lows) <= _ARRAY_MAX else _bitmap(lows)
+
+def _shrink(buf):
+    """Turn a bitmap back into an array once it has ≤ 4096 bits set."""
+    if bin(_to_bits(buf)).count("1") > _ARRAY_MAX:
+        return buf
+    return _from_lows(_positions(buf))
+
+_INT_OPS = {"or": int.__or__, "and": int.__and__, "xor": int.__xor__,
+            "sub": lambda a, b: a & ~b}
+_SET_OPS = {"or": set.__or__, "and": set.__and__, "xor": set.__xor__, "sub": set.__sub__}
+
+def _combine_chunks(a, b, op):
+    a_map, b_map = isinstance(a, bytearray), isinstance(b, bytearray)
+    if a_map and b_map:
+        return _pack(_INT_OPS[op](_to_bits(a), _to_bits(b)))
+    if not a_map and not b_map:
+        # a few thousand uint16 positions at most: the C set operations beat a Python merge
+        return _from_lows(sorted(_SET_OPS[op](set(a), set(b))))
+    if op == "and" or (op == "sub" and b_map):
+        # the result is a subset of the array side → probe one bit per element
+        lows, bitmap = (b, a) if a_map else (a, b)
+        keep = op == "and"
+        return _from_lows([low for low in lows if bool(bitmap[low >> 3] >> (low & 7) & 1) == keep])
+    # or, xor, bitmap minus array → copy the bitmap and touch one bit per array element
+    lows, buf = (b, bytearray(a)) if a_map else (a, bytearray(b))
+    for low in lows:
+        bit = 1 << (low & 7)
+        if op == "or":
+            buf[low >> 3] |= bit
+        elif op == "xor":
+            buf[low >> 3] ^= bit
+        else:
+            buf[low >> 3] &= ~bit
+    return _shrink(buf)
+
+class BitmapSet:
+    def __init__(self, iterable=()):
+        self._chunks = {}          # high 16 bits → container
+        self.update(iterable)
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        s = cls()
+        s._chunks = chunks
+        return s
+
+    # -- single elements --
+    def add(self, x):
+        high, low = x >> 16, x & 0xFFFF
+        c = self._chunks.get(high)
+        if c is None:
+            self._chunks[high] = array("H", [low])
+        elif isinstance(c, bytearray):
+            c[low >> 3] |= 1 << (low & 7)
+        else:
+            i = bisect_left(c, low)
+            if i == len(c) or c[i] != low:
+                if len(c) >= _ARRAY_MAX:
+                    self._chunks[high] = _bitmap((low,), _bitmap(c))
+                else:
+                    c.insert(i, low)
+
+    def __contains__(self, x):
+        c = self._chunks.get(x >> 16)
+        if c is None:
+            return False
+        low = x & 0xFFFF
+        if isinstance(c, bytearray):
+            return bool(c[low >> 3] >> (low & 7) & 1)
+        i = bisect_left(c, low)
+        return i < len(c) and c[i] == low
+
+    def discard(self, x):
+        high, low = x >> 16, x & 0xFFFF
+        c = self._chunks.get(high)
+        if c is None:
+            return
+        if isinstance(c, bytearray):
+            c[low >> 3] &= ~(1 << (low & 7))
+            empty = c == _EMPTY_BITMAP
+        else:
+            i = bisect_left(c, low)
+            if i < len(c) and c[i] == low:
+                del c[i]
+            empty = not c
+        if empty:
+            del self._chunks[high]
+
+    def remove(self, x):
+        if x not in self:
+            raise KeyError(x)
+        self.discard(x)
+
+    def __len__(self):
+        return sum(bin(_to_bits(c)).count("1") if isinstance(c, bytearray) else len(c)
+                   for c in self._chunks.values())
+
+    def __iter__(self):
+        for high in sorted(self._chunks):
+            c = self._chunks[high]
+            lows = _positions(c) if isinstance(c, bytearray) else c
+            base = high << 16
+            for low in lows:
+                yield base + low
+
+    def __repr__(self):
+        return f"BitmapSet({list(self)})"
+
+    def __eq__(self, other):
+        if not isinstance(other, BitmapSet):
+            return NotImplemented
+        return self._chunks.keys() == other._chunks.keys() and all(
+            _to_bits(c) == _to_bits(other._chunks[h]) for h, c in self._chunks.items())
+
+    __hash__ = None
+
+    # -- set algebra: chunk by chunk (see _combine_chunks) --
+    def _combine(self, other, op, keep_left, keep_right):
+        if not isinstance(other, BitmapSet):
+            other = BitmapSet(other)
+        chunks = {}
+        for high in self._chunks.keys() | other._chunks.keys():
+            a, b = self._chunks.get(high), other._chunks.get(high)
+            if a is None:
+                result = _copy(b) if keep_right else None
+            elif b is None:
+                result = _copy(a) if keep_left else None
+            else:
+                result = _combine_chunks(a, b, op)
+            if result is not None:
+                chunks[high] = result
+        return BitmapSet._from_chunks(chunks)
+
+    def union(self, *others):
+        result = self
+        for other in others:
+            result = result._combine(other, "or", True, True)
+        return result if others else self.copy()
+
+    def intersection(self, *others):
+        result = self
+        for other in others:
+            result = result._combine(other, "and", False, False)
+        return result if others else self.copy()
+
+    def difference(self, *others):
+        result = self
+        for other in others:
+            result = result._combine(other, "sub", True, False)
+        return result if others else self.copy()
+
+    def symmetric_difference(self, other):
+        return self._combine(other, "xor", True, True)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    # -- in-place versions --
+    def update(self, *others):
+        for other in others:
+            if isinstance(other, BitmapSet):
+                self._chunks = self.union(other)._chunks
+            else:
+                self._add_many(other)
+
+    def _add_many(self, values):
+        """Bulk add: group the IDs by chunk, then build each chunk once."""
+        groups = {}
+        for x in values:
+            lows = groups.get(x >> 16)
+            if lows is None:
+                groups[x >> 16] = lows = []
+            lows.append(x & 0xFFFF)
+        for high, lows in groups.items():
+            c = self._chunks.get(high)
+            if isinstance(c, bytearray):
+                _bitmap(lows, c)
+                continue
+            if c is not None:
+                lows.extend(c)
+            lows = sorted(set(lows))
+            self._chunks[high] = array("H", lows) if len(lows) <= _ARRAY_MAX else _bitmap(lows)
+
+    def intersection_update(self, *others):
+        self._chunks = self.intersection(*others)._chunks
+
+    def difference_update(self, *others):
+        self._chunks = self.difference(*others)._chunks
+
+    def symmetric_difference_update(self, other):
+        self._chunks = self.symmetric_difference(other)._chunks
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    # -- comparisons --
+    def issubset(self, other):
+        return len(self - other) == 0
+
+    def issuperset(self, other):
+        if not isinstance(other, BitmapSet):
+            other = BitmapSet(other)
+        return other.issubset(self)
+
+    def isdisjoint(self, other):
+        return len(self & other) == 0
+
+    def copy(self):
+        return BitmapSet._from_chunks({h: _copy(c) for h, c in self._chunks.items()})
+
+    def memory_bytes(self):
+        return sum(len(c) if isinstance(c, bytearray) else c.itemsize * len(c)
+                   for c in self._chunks.values())
+
+x = BitmapSet({1, 2, 3})
+y = BitmapSet({3, 4, 5})
+print(x | y)   # BitmapSet([1, 2, 3, 4, 5])
+print(x & y)   # BitmapSet([3])
+print(x - y)   # BitmapSet([1, 2])
+print(x ^ y)   # BitmapSet([1, 2, 4, 5])
+
+x.intersection_update({2, 3, 4})
+print(x)                                          # BitmapSet([2, 3])
+print(BitmapSet({1, 2}).issubset({1, 2, 3}))      # True
+print(BitmapSet({1, 2}).isdisjoint({4, 5}))       # True
+
+import random
+import time
+
+# The benchmarks below only run when this file is run directly: the process pool in
+# the multi-way section starts workers that re-import this file (Windows/macOS).
+if __name__ == "__main__":
+    # Memory and speed: two sets of 1 million dense IDs
+    ids_a = range(0, 2_000_000, 2)          # every even ID
+    ids_b = range(0, 2_000_000, 3)          # every third ID
+
+    plain_a, plain_b = set(ids_a), set(ids_b)
+
+    start = time.perf_counter()
+    bitmap_a, bitmap_b = BitmapSet(ids_a), BitmapSet(ids_b)
+    print("BitmapSet build (2 × 1M IDs):", time.perf_counter() - start)
+
+    plain_bytes = sys.getsizeof(plain_a) + sum(sys.getsizeof(i) for i in plain_a)
+    print(f"set:       {plain_bytes / 1024 / 1024:.1f} MB")
+    print(f"BitmapSet: {bitmap_a.memory_bytes() / 1024 / 1024:.2f} MB")
+
+    start = time.perf_counter()
+    common = plain_a & plain_b
+    print("set &:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    common_bitmap = bitmap_a & bitmap_b
+    print("BitmapSet &:", time.perf_counter() - start)
+    print(len(common) == len(common_bitmap))   # True
+
+    # Sparse IDs spread over the whole 32-bit range: every chunk stays a small array
+    rng = random.Random(0)
+    sparse_a = {rng.randrange(2 ** 32) for _ in range(5000)}
+    sparse_b = set(rng.sample(sorted(sparse_a), 2500)) | {rng.randrange(2 ** 32) for _ in range(2500)}
+    bitmap_sa, bitmap_sb = BitmapSet(sparse_a), BitmapSet(sparse_b)
+
+    start = time.perf_counter()
+    common = sparse_a & sparse_b
+    print("sparse set &:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    common_bitmap = bitmap_sa & bitmap_sb
+    print("sparse BitmapSet &:", time.perf_counter() - start)
+    print(set(common_bitmap) == common)        # True
+
+# ---- Probabilistic Sets: Bloom Filter and HyperLogLog ----
+
+"""
+An exact set must store every element, so its memory grows without limit on a stream.
+Two fixed-size alternatives, when "almost exact" is good enough:
+
+BloomFilter → "have I seen x?"
+- m bits and k hash functions; add(x) sets k bits, `x in bf` checks those k bits
+- never says "no" for something that was added; may say "yes" for something that wasn't
+  (the false-positive rate, chosen up front together with the expected capacity)
+
+HyperLogLog → "how many DIFFERENT elements have I seen?"
+- hashes each element; counts leading zero bits (long runs of zeros are rare,
+  so the longest run seen hints at how many distinct values went in)
+- 2**14 small registers (16 KB) → about 1% error, for any number of elements
+
+Both can be merged with | (e.g. one per shard/server) and saved as bytes.
+Hashes come from hashlib, not hash(), so they are the same in every process.
+Items must be str, bytes, int or float: each is turned into a fixed byte encoding
+first, and numbers that are equal in a set (1, 1.0, True) get the same encoding.
+"""
+
+import hashlib
+import math
+import struct
+
+def _encode(item):
+    """Canonical bytes for an item: same value → same bytes, in every process."""
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return b"b" + bytes(item)
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)                      # 1.0 == 1 → encode it like the int
+    if isinstance(item, int):                 # includes bool: True == 1
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, float):
+        return b"f" + struct.pack("<d", item)
+    raise TypeError(f"can only hash str, bytes, int or float, not {type(item).__name__}")
+
+def _hash128(item):
+    digest = hashlib.blake2b(_encode(item), digest_size=16).digest()
+    return struct.unpack("<QQ", digest)
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        self.m = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))   # bits
+        self.k = max(1, round(self.m / capacity * math.log(2)))                     # hashes
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def _indexes(self, item):
+        h1, h2 = _hash128(item)
+        return ((h1 + i * h2) % self.m for i in range(self.k))   # "double hashing"
+
+    def add(self, item):
+        for i in self._indexes(item):
+            self.bits[i >> 3] |= 1 << (i & 7)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        return all(self.bits[i >> 3] >> (i & 7) & 1 for i in self._indexes(item))
+
+    def __or__(self, other):
+        if (self.m, self.k) != (other.m, other.k):
+            raise ValueError("can only merge Bloom filters with the same size and hash count")
+        merged = BloomFilter.__new__(BloomFilter)
+        merged.m, merged.k = self.m, self.k
+        merged.bits = bytearray(a | b for a, b in zip(self.bits, other.bits))
+        return merged
+
+    def to_bytes(self):
+        return struct.pack("<QI", self.m, self.k) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        bf = cls.__new__(cls)
+        bf.m, bf.k = struct.unpack_from("<QI", data)
+        bf.bits = bytearray(data[12:])
+        return bf
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        self.p = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, item):
+        h = _hash128(item)[0]
+        index = h >> (64 - self.p)                  # first p bits pick a register
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1  # position of the first 1 bit
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)      # small numbers: "linear counting"
+        return round(estimate)
+
+    def __or__(self, other):
+        if self.p != other.p:
+            raise ValueError("can only merge HyperLogLogs with the same precision")
+        merged = HyperLogLog(self.p)
+        merged.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+        return merged
+
+    def to_bytes(self):
+        return bytes([self.p]) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        hll = cls(data[0])
+        hll.registers = bytearray(data[1:])
+        return hll
+
+seen = BloomFilter(capacity=100_000, error_rate=0.01)
+seen.update(["Black Tea", "Green Tea"])
+print("Green Tea" in seen, "Milk Tea" in seen)   # True False (False could rarely be True)
+
+if __name__ == "__main__":
+    # Two shards, merged
+    shard_a, shard_b = BloomFilter(100_000), BloomFilter(100_000)
+    shard_a.update(range(0, 50_000))
+    shard_b.update(range(50_000, 100_000))
+    combined = BloomFilter.from_bytes((shard_a | shard_b).to_bytes())
+    false_positives = sum(i in combined for i in range(100_000, 200_000))
+    print("All present:", all(i in combined for i in range(0, 100_000, 97)))  # True
+    print("False-positive rate:", false_positives / 100_000)                 # about 0.01
+    print("Bloom filter size:", len(combined.bits), "bytes")                  # ~117 KB, fixed
+
+    hll_a, hll_b = HyperLogLog(), HyperLogLog()
+    hll_a.update(range(0, 150_000))
+    hll_b.update(range(100_000, 250_000))        # 50,000 overlap with hll_a
+    print("Distinct (estimate):", len(hll_a | hll_b), "exact: 250000")
+    print("HyperLogLog size:", len(HyperLogLog.from_bytes(hll_a.to_bytes()).registers), "bytes")
+
+# ---- Multi-Way Set Operations (Intersecting Many Sets) ----
+
+"""
+Chained a & b & c & ... builds a temporary set at every step, in whatever order the
+sets happen to be written.
+
+Better for many sets (e.g. search-engine posting lists):
+- intersect_all(): sort the inputs by size, walk the SMALLEST one and keep only the
+  elements found in every other set; stop as soon as nothing is left
+- intersect_sorted(): for sorted integer lists, "gallop" through the bigger lists:
+  jump ahead 1, 2, 4, 8, ... positions, then binary-search the last jump → skips
+  long stretches without looking at every element
+- parallel_intersect(): very large inputs are split into chunks of the smallest set
+  and checked on several processes (threads would be held back by the GIL)
+- union_all(): one result set, every input added once
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+def union_all(*sets):
+    return set().union(*sets)
+
+def intersect_all(*sets):
+    if not sets:
+        return set()
+    smallest, *others = sorted(sets, key=len)   # small sets also reject items soonest
+    result = set()
+    for item in smallest:
+        for other in others:
+            if item not in other:
+                break
+        else:
+            result.add(item)
+    return result
+
+def _gallop(seq, target, lo):
+    """First index >= lo with seq[index] >= target, found by exponential search."""
+    step = 1
+    hi = lo
+    while hi < len(seq) and seq[hi] < target:
+        lo = hi + 1
+        hi += step
+        step *= 2
+    return bisect_left(seq, target, lo, min(hi + 1, len(seq)))
+
+def intersect_sorted(*lists):
+    """Intersection of sorted lists of distinct values, returned as a sorted list."""
+    if not lists:
+        return []
+    smallest, *others = sorted(lists, key=len)
+    positions = [0] * len(others)
+    result = []
+    for value in smallest:
+        for i, other in enumerate(others):
+            positions[i] = _gallop(other, value, positions[i])
+            if positions[i] == len(other):
+                return result           # one list is used up → nothing more can match
+            if other[positions[i]] != value:
+                break
+        else:
+            result.append(value)
+    return result
+
+@contextmanager
+def _spawn_without_script_dir():
+    """Start worker processes with PYTHONSAFEPATH=1 (Python 3.11+), then restore it.
+
+    A "spawn" worker (Windows/macOS) puts the current folder on sys.path before it
+    runs any of this file, so started from the notes folder it would import the notes
+    threading.py. Only processes started inside the with block see the setting.
+    """
+    old = os.environ.get("PYTHONSAFEPATH")
+    os.environ["PYTHONSAFEPATH"] = "1"
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop("PYTHONSAFEPATH", None)
+        else:
+            os.environ["PYTHONSAFEPATH"] = old
+
+_worker_sets = None
+
+def _init_worker(sets):
+    global _worker_sets
+    _worker_sets = sets               # sent once per worker, not once per chunk
+
+def _intersect_chunk(chunk):
+    return intersect_all(set(chunk), *_worker_sets)
+
+def parallel_intersect(*sets, workers=4, chunk_size=100_000):
+    smallest, *others = sorted(sets, key=len)
+    if len(smallest) < chunk_size:
+        return intersect_all(*sets)
+    items = list(smallest)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with _spawn_without_script_dir(), \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(others,)) as pool:
+        return union_all(*pool.map(_intersect_chunk, chunks))
+
+print(intersect_all({1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 6}))     # {3, 4}
+print(intersect_sorted([1, 3, 5, 7, 9], [3, 4, 5, 9], [0, 3, 9]))  # [3, 9]
+print(union_all({1, 2}, {2, 3}, {4}))                            # {1, 2, 3, 4}
+
+if __name__ == "__main__":   # process pools need this guard on Windows/macOS
+    # Benchmark: 100 "posting lists" of very different sizes
+    universe = 2_000_000
+    postings = [set(range(i % 7, universe, 5 + i % 90)) for i in range(100)]
+    postings.append(set(range(0, universe, 2)))          # one very common term
+
+    start = time.perf_counter()
+    chained = postings[0]
+    for s in postings[1:]:
+        chained = chained & s
+    print("chained &:", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    multi = intersect_all(*postings)
+    print("intersect_all:", time.perf_counter() - start, chained == multi)
+
+    sorted_postings = [sorted(s) for s in postings]
+    start = time.perf_counter()
+    galloped = intersect_sorted(*sorted_postings)
+    print("intersect_sorted (galloping):", time.perf_counter() - start, set(galloped) == chained)
+
+    big = [set(range(0, 1_000_000, k)) for k in (2, 3, 5, 7)]
+    start = time.perf_counter()
+    print(len(parallel_intersect(*big, workers=4)), "in", time.perf_counter() - start, "s (parallel)")
+    # Sending the big sets to each process costs time too; this pays off only with
+    # several CPU cores and inputs far larger than these.
@@ -16,14 +16,15 @@ import time
 def greet():
     print("Hello from thread")
     
-# Create thread object
-t1 = threading.Thread(target=greet)
+if __name__ == "__main__":
+    # Create thread object
+    t1 = threading.Thread(target=greet)
 
-# Start thread
-t1.start()
+    # Start thread
+    t1.start()
 
-# Wait for it to finish
-t1.join()
+    # Wait for it to finish
+    t1.join()
 
 # ------------------- 2. Passing Arguments to Thread -------------------
 
@@ -31,9 +32,10 @@ def greet_with_name(name, delay):
     time.sleep(delay)
     print(f"Hello {name}")
 
-t2 = threading.Thread(target=greet_with_name, args=("Alice", 1))
-t2.start()
-t2.join()
+if __name__ == "__main__":
+    t2 = threading.Thread(target=greet_with_name, args=("Alice", 1))
+    t2.start()
+    t2.join()
 
 # ------------------- 3. Subclassing Thread -------------------
 
@@ -41,16 +43,18 @@ class MyThread(threading.Thread):
     def run(self):
         print("Running inside subclassed thread")
 
-t3 = MyThread()
-t3.start()
-t3.join()
+if __name__ == "__main__":
+    t3 = MyThread()
+    t3.start()
+    t3.join()
 
 # ------------------- 4. Checking If Thread is Alive -------------------
 
-t4 = threading.Thread(target=time.sleep, args=(2,))
-t4.start()
-print("Is thread alive?", t4.is_alive())
-t4.join()
+if __name__ == "__main__":
+    t4 = threading.Thread(target=time.sleep, args=(2,))
+    t4.start()
+    print("Is thread alive?", t4.is_alive())
+    t4.join()
 
 # ------------------- 5. Daemon Threads -------------------
 
@@ -64,11 +68,12 @@ def background_task():
         print("Running background task...")
         time.sleep(1)
 
-daemon_thread = threading.Thread(target=background_task, daemon=True)
-daemon_thread.start()
+if __name__ == "__main__":
+    daemon_thread = threading.Thread(target=background_task, daemon=True)
+    daemon_thread.start()
 
-time.sleep(3)
-print("Main thread ending. Daemon will stop.")
+    time.sleep(3)
+    print("Main thread ending. Daemon will stop.")
 
 # ------------------- 6. Using Lock for Synchronization -------------------
 
@@ -88,16 +93,17 @@ def increment():
         with lock:  # safer than lock.acquire()/release()
             counter += 1
 
-t5 = threading.Thread(target=increment)
-t6 = threading.Thread(target=increment)
+if __name__ == "__main__":
+    t5 = threading.Thread(target=increment)
+    t6 = threading.Thread(target=increment)
 
-t5.start()
-t6.start()
+    t5.start()
+    t6.start()
 
-t5.join()
-t6.join()
+    t5.join()
+    t6.join()
 
-print("Final counter:", counter)
+    print("Final counter:", counter)
 
 # ------------------- 7. RLock (Reentrant Lock) -------------------
 
@@ -117,9 +123,10 @@ def inner():
     with rlock:
         print("Inner acquired")
 
-t7 = threading.Thread(target=outer)
-t7.start()
-t7.join()
+if __name__ == "__main__":
+    t7 = threading.Thread(target=outer)
+    t7.start()
+    t7.join()
 
 # ------------------- 8. Timer Threads -------------------
 
@@ -130,9 +137,10 @@ Thread that runs a function after a delay
 def delayed_hello():
     print("Hello after delay")
 
-timer_thread = threading.Timer(2.0, delayed_hello)
-timer_thread.start()
-timer_thread.join()
+if __name__ == "__main__":
+    timer_thread = threading.Timer(2.0, delayed_hello)
+    timer_thread.start()
+    timer_thread.join()
 
 # ------------------- 9. Event Objects -------------------
 
@@ -147,12 +155,13 @@ def wait_for_event():
     event.wait()
     print("Event triggered!")
 
-t8 = threading.Thread(target=wait_for_event)
-t8.start()
+if __name__ == "__main__":
+    t8 = threading.Thread(target=wait_for_event)
+    t8.start()
 
-time.sleep(2)
-event.set()
-t8.join()
+    time.sleep(2)
+    event.set()
+    t8.join()
 
 # ------------------- 10. Semaphore -------------------
 
@@ -169,8 +178,9 @@ def limited_access(name):
         time.sleep(2)
         print(f"{name} released semaphore")
 
-for i in range(4):
-    threading.Thread(target=limited_access, args=(f"Thread-{i}",)).start()
+if __name__ == "__main__":
+    for i in range(4):
+        threading.Thread(target=limited_access, args=(f"Thread-{i}",)).start()
 
 # ------------------- 11. Condition Variables -------------------
 
@@ -192,9 +202,664 @@ def consumer():
         condition.wait()
         print("Consumed data:", buffer.pop())
 
-threading.Thread(target=consumer).start()
-time.sleep(1)
-threading.Thread(target=producer).start()
+if __name__ == "__main__":
+    threading.Thread(target=consumer).start()
+    time.sleep(1)
+    threading.Thread(target=producer).start()
+
+# ------------------- 12. Sharded Counter (Avoiding One Global Lock) -------------------
+
+"""
+In section 6 every thread takes the same lock 100,000 times just to add 1.
+All threads queue up on that single lock, so adding threads makes it slower.
+
+Idea: give every thread its own private counter (a "shard").
+- Writes only touch the thread's own shard → no lock needed
+- Reads add up all shards → the work moves to the (rare) read side
+- snapshot() re-checks per-shard versions so the total is one consistent moment
+- The lock is used only once per thread, to register its shard
+"""
+
+class ShardedCounter:
+    def __init__(self):
+        self._local = threading.local()    # each thread sees its own attributes
+        self._shards = []                  # all shards, for reading
+        self._register_lock = threading.Lock()
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0, 0]                 # [version, count], updated in place
+            with self._register_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def increment(self, amount=1):
+        # Only the owning thread ever writes to this shard.
+        # The version is odd while an update is in progress ("seqlock").
+        shard = self._shard()
+        shard[0] += 1
+        shard[1] += amount
+        shard[0] += 1
+
+    def value(self):
+        # Weakly consistent, lock-free read: may miss increments still in flight
+        return sum(shard[1] for shard in self._shards)
+
+    def snapshot(self):
+        """Consistent total: a sum of counts that all held at the same moment.
+
+        Read every (version, count), then re-read the versions. If no shard was
+        being updated and none changed in between, all the counts were valid at
+        the same time; otherwise try again.
+        """
+        while True:
+            shards = list(self._shards)
+            before = [(shard[0], shard[1]) for shard in shards]
+            if any(version % 2 for version, _ in before):
+                continue
+            if len(shards) == len(self._shards) and all(
+                    shard[0] == version for shard, (version, _) in zip(shards, before)):
+                return sum(count for _, count in before)
+
+sharded = ShardedCounter()
+
+def sharded_increment():
+    for _ in range(100000):
+        sharded.increment()
+
+if __name__ == "__main__":
+    workers = [threading.Thread(target=sharded_increment) for _ in range(2)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    print("Sharded counter:", sharded.snapshot())  # 200000
+
+# Benchmark: one global lock vs sharded counter
+def run_threads(target, n_threads):
+    threads = [threading.Thread(target=target) for _ in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    for n_threads in (2, 8, 32):
+        bench_counter = 0
+        bench_lock = threading.Lock()
+
+        def locked_loop():
+            global bench_counter
+            for _ in range(20000):
+                with bench_lock:
+                    bench_counter += 1
+
+        bench_sharded = ShardedCounter()
+
+        def sharded_loop():
+            for _ in range(20000):
+                bench_sharded.increment()
+
+        locked_time = run_threads(locked_loop, n_threads)
+        sharded_time = run_threads(sharded_loop, n_threads)
+        print(f"{n_threads} threads → lock: {locked_time:.4f}s, sharded: {sharded_time:.4f}s")
+
+# ------------------- 13. Bounded Batching Channel (Producer-Consumer) -------------------
+
+"""
+Problems with the section 11 example:
+- If producer runs before consumer waits, notify() is lost and consumer waits forever
+- buffer can grow without limit (no back-pressure)
+- One wakeup moves only one item
+
+Fixes:
+- Always wait on a condition *predicate* (wait_for) instead of a bare wait()
+- Use a fixed-size ring buffer → producers block when it is full
+- put_many() / get_batch() move many items per lock acquisition and wakeup
+"""
+
+class BoundedChannel:
+    def __init__(self, capacity):
+        self._items = [None] * capacity   # ring buffer storage
+        self._capacity = capacity
+        self._head = 0                    # index of the oldest item
+        self._count = 0
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def put(self, item, timeout=None):
+        return self.put_many([item], timeout) == 1
+
+    def put_many(self, items, timeout=None):
+        """Put all items, blocking while the buffer is full. Returns how many were put."""
+        items = list(items)
+        done = 0
+        with self._not_full:
+            while done < len(items):
+                if not self._not_full.wait_for(lambda: self._count < self._capacity, timeout):
+                    break  # timed out
+                free = self._capacity - self._count
+                for item in items[done:done + free]:
+                    self._items[(self._head + self._count) % self._capacity] = item
+                    self._count += 1
+                    done += 1
+                self._not_empty.notify_all()
+        return done
+
+    def get_batch(self, max_items, timeout=None):
+        """Return up to max_items items; [] if nothing arrived before timeout."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._count > 0, timeout):
+                return []
+            batch = []
+            while self._count and len(batch) < max_items:
+                batch.append(self._items[self._head])
+                self._items[self._head] = None
+                self._head = (self._head + 1) % self._capacity
+                self._count -= 1
+            self._not_full.notify_all()
+            return batch
+
+channel = BoundedChannel(capacity=4)
+
+def channel_consumer():
+    # Starting late is fine: the predicate sees the items already in the buffer
+    print("Consumed batch:", channel.get_batch(10))
+
+if __name__ == "__main__":
+    channel.put_many(["a", "b", "c"])
+    late_consumer = threading.Thread(target=channel_consumer)
+    late_consumer.start()
+    late_consumer.join()   # Consumed batch: ['a', 'b', 'c']
+
+# Benchmark: throughput and tail latency for different batch sizes
+def bench_channel(batch_size, n_producers=2, n_consumers=2, items_per_producer=20000):
+    chan = BoundedChannel(capacity=max(1024, batch_size))
+    latencies = []
+    lat_lock = threading.Lock()
+    stop = object()
+
+    def produce():
+        for i in range(0, items_per_producer, batch_size):
+            n = min(batch_size, items_per_producer - i)
+            chan.put_many([time.perf_counter()] * n)
+
+    def consume():
+        local = []
+        while True:
+            batch = chan.get_batch(batch_size)
+            now = time.perf_counter()
+            for i, sent in enumerate(batch):
+                if sent is stop:
+                    chan.put_many(batch[i + 1:])  # leave other consumers' stop markers
+                    with lat_lock:
+                        latencies.extend(local)
+                    return
+                local.append(now - sent)
+
+    consumers = [threading.Thread(target=consume) for _ in range(n_consumers)]
+    producers = [threading.Thread(target=produce) for _ in range(n_producers)]
+    start = time.perf_counter()
+    for t in consumers + producers:
+        t.start()
+    for t in producers:
+        t.join()
+    for _ in consumers:
+        chan.put(stop)
+    for t in consumers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return len(latencies) / elapsed, p99
+
+if __name__ == "__main__":
+    for batch_size in (1, 16, 256, 1024):
+        throughput, p99 = bench_channel(batch_size)
+        print(f"batch={batch_size:5d} → {throughput:,.0f} items/s, p99 latency: {p99 * 1000:.2f} ms")
+
+# ------------------- 14. Worker Pool with Work Stealing -------------------
+
+"""
+Sections 2, 3 and 10 start a brand-new Thread for every small job.
+Creating and destroying an OS thread costs far more than most small jobs.
+
+A worker pool starts N threads once and feeds them tasks:
+- submit(fn, *args) → returns a Future (call .result() to get the value)
+- map(fn, items, chunksize) → submits all chunks right away, yields results in order
+- max_concurrency → how many tasks may run at once (replaces the Semaphore)
+
+Work stealing:
+- submit() from outside the pool puts tasks in a shared FIFO "injector" queue,
+  so tasks submitted first start first
+- A task submitted BY a worker goes onto that worker's own deque; the worker
+  takes its own newest task from the right end (LIFO, still hot in cache)
+- When both are empty it "steals" the oldest task from another worker's left end
+So when some tasks are much slower than others, idle workers still find work.
+
+A task that waits for tasks it submitted itself must use pool.result(future), not
+future.result(): a plain .result() blocks the worker thread, and if every worker
+does that, nobody is left to run the children → deadlock. pool.result() keeps
+running queued tasks (its own first) until the future is done.
+
+deque.append()/pop()/popleft() are atomic, so taking and stealing need no lock.
+The Condition is only used to put idle workers to sleep and wake them up.
+"""
+
+from collections import deque
+from concurrent.futures import Future
+
+class WorkStealingPool:
+    def __init__(self, n_workers=4, max_concurrency=None):
+        self._injector = deque()                              # tasks from outside (FIFO)
+        self._queues = [deque() for _ in range(n_workers)]   # tasks spawned by each worker
+        self._limit = threading.Semaphore(max_concurrency) if max_concurrency else None
+        self._local = threading.local()                      # .index inside worker threads
+        self._work_ready = threading.Condition()
+        self._idle = 0
+        self._shutdown = False
+        self._workers = [
+            threading.Thread(target=self._worker, args=(i,), daemon=True)
+            for i in range(n_workers)
+        ]
+        for w in self._workers:
+            w.start()
+
+    def submit(self, fn, *args, **kwargs):
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future = Future()
+        task = (future, fn, args, kwargs)
+        index = getattr(self._local, "index", None)
+        if index is None:
+            self._injector.append(task)
+        else:
+            self._queues[index].append(task)
+        # Workers register as idle before their final check for work, so this
+        # check cannot miss a worker that is about to sleep
+        if self._idle:
+            with self._work_ready:
+                self._work_ready.notify()
+        return future
+
+    def map(self, fn, iterable, chunksize=1):
+        items = list(iterable)
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+        # Submit now (like Executor.map), not when the caller starts iterating
+        futures = [self.submit(lambda chunk: [fn(x) for x in chunk], c) for c in chunks]
+
+        def results():
+            for future in futures:
+                yield from self.result(future)
+        return results()
+
+    def result(self, future):
+        """future.result(), but a worker runs other queued tasks while it waits."""
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            while not future.done():
+                task = self._take_task(index)
+                if task is None:
+                    break          # the task we wait for is already running somewhere
+                self._run(*task)
+        return future.result()
+
+    def shutdown(self, wait=True):
+        with self._work_ready:
+            self._shutdown = True
+            self._work_ready.notify_all()
+        if wait:
+            for w in self._workers:
+                w.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def _has_work(self):
+        return bool(self._injector) or any(self._queues)
+
+    def _take_task(self, index):
+        try:
+            return self._queues[index].pop()          # own newest task
+        except IndexError:
+            pass
+        try:
+            return self._injector.popleft()           # oldest submitted task
+        except IndexError:
+            pass
+        for offset in range(1, len(self._queues)):
+            victim = self._queues[(index + offset) % len(self._queues)]
+            try:
+                return victim.popleft()               # steal oldest task
+            except IndexError:
+                continue
+        return None
+
+    def _worker(self, index):
+        self._local.index = index
+        while True:
+            # Take a concurrency slot BEFORE taking a task: a worker waiting for a slot
+            # then never sits on a task that a running task is waiting for
+            if self._limit:
+                self._limit.acquire()
+            try:
+                task = self._take_task(index)
+                if task is not None:
+                    self._run(*task)   # tasks run inside pool.result() share this slot
+            finally:
+                if self._limit:
+                    self._limit.release()
+            if task is not None:
+                continue
+            with self._work_ready:
+                self._idle += 1
+                try:
+                    while not self._has_work():
+                        if self._shutdown:
+                            return  # shut down and no work left
+                        self._work_ready.wait()
+                finally:
+                    self._idle -= 1
+
+    def _run(self, future, fn, args, kwargs):
+        if not future.set_running_or_notify_cancel():
+            return  # cancelled before it started
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+def pooled_access(name):
+    print(f"{name} running")
+    time.sleep(0.2)
+    return name
+
+if __name__ == "__main__":
+    # Same idea as section 10, but no new threads are created per task
+    with WorkStealingPool(n_workers=4, max_concurrency=2) as pool:
+        futures = [pool.submit(pooled_access, f"Task-{i}") for i in range(4)]
+        print("Results:", [f.result() for f in futures])
+        print("Squares:", list(pool.map(lambda x: x * x, range(10), chunksize=3)))
+
+# Tasks that split into child tasks and wait for them
+def tree_sum(pool, lo, hi):
+    if hi - lo <= 1000:
+        return sum(range(lo, hi))
+    mid = (lo + hi) // 2
+    left = pool.submit(tree_sum, pool, lo, mid)      # goes onto this worker's own deque
+    right = pool.submit(tree_sum, pool, mid, hi)
+    return pool.result(left) + pool.result(right)    # runs queued tasks while waiting
+
+if __name__ == "__main__":
+    with WorkStealingPool(n_workers=2) as pool:
+        parents = [pool.submit(tree_sum, pool, 0, 100_000) for _ in range(2)]
+        print("Tree sums:", [f.result() for f in parents])   # [4999950000, 4999950000]
+
+# Benchmark: one Thread per task vs reusing pool workers
+def tiny_task(n):
+    return sum(range(n))
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    for i in range(2000):
+        t = threading.Thread(target=tiny_task, args=(i % 100,))
+        t.start()
+        t.join()
+    print("Thread per task:", time.perf_counter() - start)
+
+    with WorkStealingPool(n_workers=4) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(tiny_task, i % 100) for i in range(2000)]
+        for f in futures:
+            f.result()
+        print("Work-stealing pool:", time.perf_counter() - start)
+
+# ------------------- 15. Timing Wheel (Many Timers, One Thread) -------------------
+
+"""
+threading.Timer (section 8) starts one OS thread per delayed call.
+With tens of thousands of timeouts that means tens of thousands of threads.
+
+A hashed timing wheel uses ONE thread for all timers:
+- Time is cut into ticks (e.g. 10 ms); the wheel is a ring of slots, one per tick
+- A timer goes into slot (current_tick + delay_ticks) % n_slots → O(1) schedule
+- Delays longer than one turn of the wheel just store how many "rounds" are left
+- cancel() removes the timer from its slot (a dict) → O(1) cancel
+- The wheel thread computes each wake-up from the start time, not from
+  "now + tick", so slow callbacks don't make the timers drift later and later
+- A timer's tick is rounded UP from the absolute time it is due, and tick k is only
+  processed once k * tick seconds have really passed → a timer is never early
+  (like threading.Timer), at most one tick late
+"""
+
+import math
+
+import traceback
+
+class WheelTimer:
+    __slots__ = ("callback", "args", "interval", "rounds", "slot", "wheel")
+
+    def cancel(self):
+        self.wheel._cancel(self)
+
+class TimingWheel:
+    def __init__(self, tick=0.01, n_slots=512):
+        self._tick = tick
+        self._slots = [{} for _ in range(n_slots)]  # dict used as an ordered set
+        self._current = 0                          # ticks processed so far
+        self._start = time.monotonic()             # tick k is due at start + k * tick
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule(self, delay, callback, *args, repeat=False):
+        """Call callback(*args) after delay seconds (every delay seconds if repeat)."""
+        timer = WheelTimer()
+        timer.callback, timer.args, timer.wheel = callback, args, self
+        timer.interval = delay if repeat else None
+        with self._lock:
+            self._place(timer, delay)
+        return timer
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _place(self, timer, delay):
+        due_tick = math.ceil((time.monotonic() - self._start + delay) / self._tick)
+        ticks = max(1, due_tick - self._current)
+        timer.rounds, offset = divmod(ticks, len(self._slots))
+        if offset == 0:             # exactly a whole number of turns
+            timer.rounds -= 1
+        timer.slot = (self._current + ticks) % len(self._slots)
+        self._slots[timer.slot][timer] = None
+
+    def _cancel(self, timer):
+        with self._lock:
+            self._slots[timer.slot].pop(timer, None)
+
+    def _run(self):
+        while not self._stop.is_set():
+            # Sleep until the next tick boundary measured from the start (drift correction)
+            deadline = self._start + (self._current + 1) * self._tick
+            self._stop.wait(max(0, deadline - time.monotonic()))
+            # Catch up on every tick whose time has fully passed (if a callback was slow)
+            while self._start + (self._current + 1) * self._tick <= time.monotonic():
+                self._advance()
+
+    def _advance(self):
+        with self._lock:
+            self._current += 1
+            slot = self._slots[self._current % len(self._slots)]
+            due = []
+            for timer in list(slot):
+                if timer.rounds:
+                    timer.rounds -= 1
+                else:
+                    del slot[timer]
+                    due.append(timer)
+            for timer in due:
+                if timer.interval:
+                    self._place(timer, timer.interval)
+        for timer in due:
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                # Like threading.Timer: report the error, but one failing
+                # callback must not stop the wheel or the other timers
+                traceback.print_exc()
+
+import tracemalloc
+
+def noop():
+    pass
+
+if __name__ == "__main__":
+    wheel = TimingWheel(tick=0.01)
+
+    wheel.schedule(0.2, delayed_hello)                          # Hello after delay
+    cancelled = wheel.schedule(0.1, print, "You will not see this")
+    cancelled.cancel()
+    ticker = wheel.schedule(0.05, print, "tick", repeat=True)
+    time.sleep(0.3)
+    ticker.cancel()
+
+    # Benchmark: memory and time to set up many pending timers
+    tracemalloc.start()
+    start = time.perf_counter()
+    wheel_timers = [wheel.schedule(60, noop) for _ in range(100_000)]
+    wheel_time = time.perf_counter() - start
+    wheel_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for timer in wheel_timers:
+        timer.cancel()
+    print(f"TimingWheel: 100,000 timers in {wheel_time:.3f}s, {wheel_mem / 100_000:.0f} bytes each")
+
+    # 100,000 real threads would exhaust most systems, so time 1,000 and compare per timer
+    tracemalloc.start()
+    start = time.perf_counter()
+    thread_timers = [threading.Timer(60, noop) for _ in range(1_000)]
+    for timer in thread_timers:
+        timer.start()
+    thread_time = time.perf_counter() - start
+    thread_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    for timer in thread_timers:
+        timer.cancel()
+    print(f"threading.Timer: 1,000 timers in {thread_time:.3f}s, {thread_mem / 1_000:.0f} bytes each "
+          "(plus one OS thread stack each)")
+
+    wheel.stop()
+
+# ------------------- 16. Processes for CPU-Bound Work (Beating the GIL) -------------------
+
+"""
+Because of the GIL, the increment() loop from section 6 runs no faster on 4 threads than on 1.
+For CPU-bound work use processes: each process has its own interpreter and its own GIL.
+
+HybridExecutor offers the same submit()/map() interface as the pool above and
+picks the backend per task:
+- kind="io"  → thread pool  (cheap, shares memory, good while waiting on I/O)
+- kind="cpu" → process pool (real parallelism on all cores)
+
+Arguments sent to a process are normally pickled and copied.
+For big bytes/array payloads, put them in shared memory once and send only its name;
+the worker attaches to the same memory and reads it through a memoryview (no copy).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+class HybridExecutor:
+    def __init__(self, max_threads=8, max_processes=None):
+        self._threads = ThreadPoolExecutor(max_threads)
+        self._processes = ProcessPoolExecutor(max_processes or os.cpu_count())
+
+    def submit(self, fn, *args, kind="io"):
+        pool = self._processes if kind == "cpu" else self._threads
+        return pool.submit(fn, *args)
+
+    def map(self, fn, iterable, kind="io", chunksize=1):
+        pool = self._processes if kind == "cpu" else self._threads
+        return pool.map(fn, iterable, chunksize=chunksize)
+
+    def shutdown(self):
+        self._threads.shutdown()
+        self._processes.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+def share_bytes(data):
+    """Copy data into a new shared memory block; send (name, size) to workers instead of data."""
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    block.buf[:len(data)] = data
+    return block
+
+def checksum_shared(name, start, end):
+    block = shared_memory.SharedMemory(name=name)  # attach, no copy
+    try:
+        view = block.buf[start:end]
+        total = sum(view)
+        view.release()
+        return total
+    finally:
+        block.close()
+
+# CPU-heavy functions: increment() from section 6 without the lock,
+# and an iterative version of factorial() from functions.py (recursion is too deep for big n)
+def cpu_increment(n=2_000_000):
+    count = 0
+    for _ in range(n):
+        count += 1
+    return count
+
+def cpu_factorial(n=3000):
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result.bit_length()
+
+# Process pools re-import this file on some platforms (Windows/macOS). That is why
+# every demo in these notes sits behind the __main__ guard: the workers only need
+# the functions, not the demos (which would otherwise all run again in each worker).
+if __name__ == "__main__":
+    with HybridExecutor() as executor:
+        payload = bytes(range(256)) * 40_000          # ~10 MB
+        block = share_bytes(payload)
+        try:
+            step = len(payload) // 4
+            parts = [executor.submit(checksum_shared, block.name, i, i + step, kind="cpu")
+                     for i in range(0, len(payload), step)]
+            print("Shared-memory checksum:", sum(p.result() for p in parts) == sum(payload))
+        finally:
+            block.close()
+            block.unlink()
+
+        jobs = [cpu_increment, cpu_factorial] * os.cpu_count()
+        for kind in ("io", "cpu"):
+            start = time.perf_counter()
+            futures = [executor.submit(job, kind=kind) for job in jobs]
+            for f in futures:
+                f.result()
+            print(f"{len(jobs)} CPU-bound jobs on {'threads' if kind == 'io' else 'processes'}:",
+                  f"{time.perf_counter() - start:.2f}s")
 
 # ------------------- Summary -------------------
 
@@ -208,6 +873,11 @@ threading.Thread(target=producer).start()
 ✔ Event → control flow using flags
 ✔ Timer → delayed execution
 ✔ Condition → complex communication
+✔ ShardedCounter → per-thread shards, no lock on the hot path
+✔ BoundedChannel → ring buffer with back-pressure and batched put/get
+✔ WorkStealingPool → reuse threads, submit()/map(), steal work when idle
+✔ TimingWheel → thousands of timers on one thread, O(1) schedule/cancel
+✔ HybridExecutor → threads for I/O, processes (+ shared memory) for CPU work
 """
 
 # ------------------- End of Threading Notes -------------------